@@ -0,0 +1,21 @@
+"""
+ASCII banner shown once by setup_logger; kept apart so plain imports of utils stay small.
+"""
+from rich.text import Text
+
+BANNER = r"""
+  ██▀███   ▓█████  ▄████▄   ▒█████   ███▄    █  ▄▄▄██▀▀▀ ██▓ ██▓    ▄▄▄█████▓▓█████  ██▀███      
+  ▓██ ▒ ██▒▓█   ▀ ▒██▀ ▀█  ▒██▒  ██▒ ██ ▀█   █    ▒██    ▓██▒▓██▒    ▓  ██▒ ▓▒▓█   ▀ ▓██ ▒ ██▒   
+  ▓██ ░▄█ ▒▒███   ▒▓█    ▄ ▒██░  ██▒▓██  ▀█ ██▒   ░██    ▒██▒▒██░    ▒ ▓██░ ▒░▒███   ▓██ ░▄█ ▒   
+  ▒██▀▀█▄  ▒▓█  ▄ ▒▓▓▄ ▄██▒▒██   ██░▓██▒  ▐▌██▒ ▓██▄██▓  ░██░▒██░    ░ ▓██▓ ░ ▒▓█  ▄ ▒██▀▀█▄     
+  ░██▓ ▒██▒░▒████▒▒ ▓███▀ ░░ ████▓▒░▒██░   ▓██░  ▓███▒   ░██░░██████▒  ▒██▒ ░ ░▒████▒░██▓ ▒██▒   
+  ░ ▒▓ ░▒▓░░░ ▒░ ░░ ░▒ ▒  ░░ ▒░▒░▒░ ░ ▒░   ▒ ▒   ▒▓▒▒░   ░▓  ░ ▒░▓  ░  ▒ ░░   ░░ ▒░ ░░ ▒▓ ░▒▓░   
+    ░▒ ░ ▒░ ░ ░  ░  ░  ▒     ░ ▒ ▒░ ░ ░░   ░ ▒░   ▒ ░▒░    ▒ ░░ ░ ▒  ░    ░     ░ ░  ░  ░▒ ░ ▒░  
+    ░░   ░    ░   ░        ░ ░ ░ ▒     ░   ░ ░    ░ ░ ░    ▒ ░  ░ ░     ░       ░     ░░   ░     
+     ░        ░  ░░ ░          ░ ░           ░    ░   ░    ░      ░  ░          ░  ░   ░         
+             ░                                                                                   
+             Professional Stream Processing Engine for System Logs & Recon Data                  
+"""
+
+# Styled once here instead of markup-parsing the ~1 KB literal on every print
+BANNER_TEXT = Text(BANNER, style="bold blue")
@@ -7,15 +7,13 @@ import tempfile
 import json
 import typer
 from pathlib import Path
-from rich.console import Console
+from recon_filter.io import console
 from rich.table import Table
 
 from recon_filter.config import FilterConfig
-from recon_filter.engine.core import EngineProcessor
 from recon_filter.utils import setup_logger
 
 app = typer.Typer()
-console = Console()
 
 def generate_synthetic_payload(target_path: Path, mb_size: int = 100):
     """Writes a structural pseudo-log payload targeting MB constraints natively."""
@@ -39,6 +37,8 @@ def benchmark_cmd(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose tracing."),
 ):
     logger = setup_logger(verbose)
+    # The engine is only loaded by the command that runs it, not by every CLI startup
+    from recon_filter.engine.core import EngineProcessor
     
     with tempfile.TemporaryDirectory() as tmp_dir:
         target_path = Path(tmp_dir) / "benchmark_payload.log"
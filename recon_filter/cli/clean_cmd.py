@@ -5,7 +5,6 @@ import shutil
 from pathlib import Path
 
 import typer
-import questionary
 
 from recon_filter.utils import setup_logger
 from recon_filter.engine.cache import CacheManager
@@ -22,6 +21,7 @@ def clean_cmd(
     root = Path(target_dir).resolve()
     
     if not force:
+        import questionary
         confirm = questionary.confirm(
             f"WARNING: This will recursively delete all `.bak` backups, `/logs` directories, and `.recon_cache` signatures inside {root}. Proceed?"
         ).ask()
@@ -4,13 +4,12 @@ Diagnoses RAM capacity, thread allowances, dependency installations, and permiss
 import sys
 import os
 import typer
-from rich.console import Console
+from recon_filter.io import console
 from rich.table import Table
 
 from recon_filter.utils import setup_logger
 
 app = typer.Typer()
-console = Console()
 
 @app.command("doctor", help="Diagnostic tool auditing environment, hardware, and installation requirements.")
 def doctor_cmd(
@@ -7,24 +7,24 @@ import json
 import csv
 import mimetypes
 import concurrent.futures
+import multiprocessing
+import threading
 from pathlib import Path
 from typing import List, Optional
 
 import typer
-import questionary
-from rich.console import Console
+from recon_filter.io import console
 from rich.table import Table
 
 from recon_filter.config import FilterConfig, ConfigManager
-from recon_filter.engine.core import EngineProcessor
-from recon_filter.engine.concurrency import ConcurrencyManager
 from recon_filter.utils import setup_logger
 
 app = typer.Typer()
-console = Console()
 
 def get_interactive_inputs(logger) -> tuple[List[Path], str, str]:
     """Uses Questionary to prompt user dynamically gracefully."""
+    import questionary
+
     console.print("\n[bold yellow]Interactive Mode Engaged[/bold yellow] (Missing parameters detected)\n")
     
     target_dir = questionary.path(
@@ -65,6 +65,12 @@ def get_interactive_inputs(logger) -> tuple[List[Path], str, str]:
 
     return [Path(target_dir)], regex_pattern, keyword_file
 
+def _process_file(file_path: Path, output_dir: Optional[Path], config: FilterConfig) -> dict:
+    """Module-level worker so it can be pickled into ProcessPoolExecutor children."""
+    from recon_filter.engine.core import EngineProcessor
+    processor = EngineProcessor(file_path, output_dir, config)
+    return processor.process()
+
 def _expand_files(targets: List[Path], recursive: bool, excludes: List[str]) -> List[Path]:
     resolved_files = set()
     for target in targets:
@@ -110,6 +116,7 @@ def filter_cmd(
     force_format: Optional[str] = typer.Option(None, "--force-format", help="Override output formatting preservation bindings natively (txt, json, csv, pdf)."),
     encoding: Optional[str] = typer.Option(None, "--encoding", help="Manually enforce structural charset bindings."),
     safe_mode: bool = typer.Option(True, "--safe-mode/--no-safe-mode", help="Toggle Regex complexity checking and Sandbox bounds."),
+    use_re2: bool = typer.Option(False, "--re2", help="Run the regex on RE2's linear-time engine when google-re2 is installed (no backreferences/lookaround)."),
     preview: bool = typer.Option(False, "--preview", "-p", help="Render first hits natively simulating matches without making IO replacements."),
     dry_run: bool = typer.Option(False, "--dry-run", help="Simulate pipeline without performing disk IO."),
     append: bool = typer.Option(False, "--append", "-a", help="Append to outputs instead of overwriting."),
@@ -144,7 +151,10 @@ def filter_cmd(
     # Auditing / Checksums
     no_backup: bool = typer.Option(False, "--no-backup", help="Disable structural source file backups."),
     backup_dir: Optional[str] = typer.Option(None, "--backup-dir", help="Shift backup `.bak` entities into isolated domains."),
-    generate_hash_report: bool = typer.Option(False, "--generate-hash-report", help="Calculate contextual SHA256 integrity sums internally."),
+    backup_content_only: bool = typer.Option(False, "--backup-content-only", help="Copy backup contents only, without the source timestamps."),
+    generate_hash_report: bool = typer.Option(False, "--generate-hash-report", help="Calculate contextual integrity sums (see --hash-algo) internally."),
+    hash_algo: str = typer.Option("sha256", "--hash-algo", help="Digest for hash reports and cache keys (sha256/blake3). blake3 needs the blake3 package."),
+    hash_sample_mb: Optional[int] = typer.Option(None, "--hash-sample-mb", help="Hash files above this size (MB) by head/middle/tail samples instead of in full."),
     export_stats: Optional[str] = typer.Option(None, "--export-stats", help="Dump final statistics payload structurally to this JSON location."),
     report_format: str = typer.Option("json", "--report-format", help="Dictates structure of the exported metrics report (json/csv)."),
     
@@ -190,6 +200,7 @@ def filter_cmd(
                 match_limit=limit,
                 timeout=timeout,
                 safe_mode=safe_mode,
+                use_re2=use_re2,
                 force_format=force_format,
                 encoding=encoding,
                 memory_limit_mb=memory_limit,
@@ -205,7 +216,10 @@ def filter_cmd(
                 report_format=report_format,
                 no_backup=no_backup,
                 backup_dir=backup_dir,
+                backup_content_only=backup_content_only,
                 generate_hash_report=generate_hash_report,
+                hash_algo=hash_algo,
+                hash_sample_threshold_mb=hash_sample_mb,
                 performance_report=performance_report,
                 strict_url=strict_url,
                 allow_no_scheme=allow_no_scheme,
@@ -275,17 +289,14 @@ def filter_cmd(
     total_matches = 0
     
     # Map thread boundaries
+    from recon_filter.engine.concurrency import ConcurrencyManager
     workers = ConcurrencyManager.resolve_optimal_workers(config.max_workers, config.no_parallel, config.safe_parallel)
 
-    def process_file_bound(file_path: Path) -> dict:
-        processor = EngineProcessor(file_path, output_dir, config)
-        return processor.process()
-
     try:
         if workers == 1 or total_files == 1:
             # Synchronous explicit execution
             for file_path in resolved_files:
-                stats = process_file_bound(file_path)
+                stats = _process_file(file_path, output_dir, config)
                 global_stats.append(stats)
                 total_lines += stats["lines_scanned"]
                 total_matches += stats["matches_found"]
@@ -296,9 +307,14 @@ def filter_cmd(
                         console.print(f"  {idx+1}: {buf.rstrip()}")
                     console.print("-" * 40)
         else:
-            # Parallel Multi-Asset Logic Engine Mapping (Using Threads to avoid IPC payload lag on fast files)
-            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
-                future_to_file = {executor.submit(process_file_bound, f): f for f in resolved_files}
+            # Parallel Multi-Asset Logic Engine Mapping (Processes sidestep the GIL; each file's dedupe state is independent)
+            # Forking while another thread (e.g. an opted-in background update check) holds a lock can
+            # deadlock the children, so only fork from a single-threaded parent
+            mp_context = None
+            if threading.active_count() > 1 and "forkserver" in multiprocessing.get_all_start_methods():
+                mp_context = multiprocessing.get_context("forkserver")
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+                future_to_file = {executor.submit(_process_file, f, output_dir, config): f for f in resolved_files}
                 for future in concurrent.futures.as_completed(future_to_file):
                     file_path = future_to_file[future]
                     try:
@@ -5,14 +5,12 @@ import tempfile
 from pathlib import Path
 
 import typer
-from rich.console import Console
+from recon_filter.io import console
 from rich.table import Table
 
 from recon_filter.config import FilterConfig
-from recon_filter.engine.core import EngineProcessor
 
 app = typer.Typer()
-console = Console()
 
 def _run_test(name: str, test_func) -> bool:
     """Executes a bound callable trapping execution fragments natively."""
@@ -26,6 +24,7 @@ def _run_test(name: str, test_func) -> bool:
 @app.command("self-test", help="Excercises all Strategy Core systems locally guaranteeing system parity.")
 def selftest_cmd():
     console.print("\n[cyan]Initializing V1.0.0 System Parity Core Self-Tests...[/cyan]")
+    from recon_filter.engine.core import EngineProcessor
     
     results = {}
     
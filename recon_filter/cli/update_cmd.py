@@ -4,13 +4,11 @@ with distro-specific package manager detection.
 """
 import typer
 from pathlib import Path
-from rich.console import Console
+from recon_filter.io import console
 from rich.table import Table
 from recon_filter.version import __version__
-from recon_filter.engine.update_check import UpdateChecker
 
 app = typer.Typer()
-console = Console()
 
 
 def _detect_distro() -> str:
@@ -70,6 +68,7 @@ def update_cmd(
 
     if check:
         console.print("[cyan]Connecting to upstream releases...[/cyan]")
+        from recon_filter.engine.update_check import UpdateChecker
         checker = UpdateChecker()
         checker.check_for_updates(force=True)
 
@@ -5,13 +5,12 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
+from recon_filter.io import console
 
 from recon_filter.engine.filtering import RuleCompiler
 from recon_filter.utils import setup_logger
 
 app = typer.Typer()
-console = Console()
 
 @app.command("validate", help="Strictly validate Regex patterns or keyword files before executing pipelines.")
 def validate_cmd(
@@ -45,6 +45,7 @@ class FilterConfig:
     match_limit: Optional[int] = None
     timeout: Optional[int] = None
     safe_mode: bool = False
+    use_re2: bool = False # Run regex_pattern on RE2 (linear time, no backreferences) when installed
     
     # File Encoding & Formatting
     force_format: Optional[str] = None
@@ -70,8 +71,12 @@ class FilterConfig:
     report_format: str = "json" # "json" | "csv"
     no_backup: bool = False
     backup_dir: Optional[str] = None
+    backup_content_only: bool = False # Skip copying the source timestamps onto the backup
     generate_hash_report: bool = False
+    hash_algo: str = "sha256" # "sha256" | "blake3"
+    hash_sample_threshold_mb: Optional[int] = None # Inputs above this are hashed by head/middle/tail samples
     performance_report: bool = False
+    enable_cache: bool = True
     
     # URL & Cluster Engines
     strict_url: bool = False
@@ -99,6 +104,18 @@ class FilterConfig:
         if self.dedupe_scope not in ["line", "normalized", "url-normalized"]:
             raise ValueError("dedupe_scope must be 'line', 'normalized', or 'url-normalized'")
 
+        self.hash_algo = self.hash_algo.lower()
+        if self.hash_algo not in ["sha256", "blake3"]:
+            raise ValueError("hash_algo must be 'sha256' or 'blake3'")
+        if self.hash_algo == "blake3":
+            from recon_filter.security import integrity
+            if not integrity.HAS_BLAKE3:
+                # Refused rather than quietly hashing with SHA-256 under a blake3 label
+                raise ValueError("hash_algo 'blake3' requires the blake3 package. Install with: pip install recon-filter[speedups]")
+
+        if self.hash_sample_threshold_mb is not None and self.hash_sample_threshold_mb < 1:
+            raise ValueError("hash_sample_threshold_mb must be at least 1")
+
 
 class ConfigManager:
     """
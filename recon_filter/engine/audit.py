@@ -1,13 +1,13 @@
 """
 Audit subsystem for writing non-repudiable execution tracking payloads.
 """
-import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 
 
 from recon_filter.config import FilterConfig
+from recon_filter.engine.serialization import dumps_bytes
 
 class AuditLogger:
     """Writes strictly JSON formatted execution metadata to a central tracking log."""
@@ -41,5 +41,5 @@ class AuditLogger:
         }
         
         # Append as a JSONL (JSON Lines) to avoid massive array parse overheads in huge logs
-        with self.audit_path.open('a', encoding='utf-8') as f:
-            f.write(json.dumps(entry) + "\n")
+        with self.audit_path.open('ab') as f:
+            f.write(dumps_bytes(entry) + b"\n")
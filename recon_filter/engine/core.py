@@ -1,10 +1,14 @@
 """
 Core orchestrator managing the Strategy Pattern resolution and file lifecycle dynamically.
 """
+import io
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Type, Optional, Tuple
+from typing import Dict, Any, Type, Optional, Tuple, Callable
 
 from recon_filter.config import FilterConfig
 from recon_filter.security.sandbox import enforce_memory_sandbox, validate_path_traversal
@@ -18,12 +22,19 @@ from recon_filter.version import __version__
 from recon_filter.engine.performance import PerformanceMonitor
 from recon_filter.engine.url_analyzer import UrlAnalyzer
 from recon_filter.engine.smart_engine import IntelligenceEngine
+from recon_filter.engine.serialization import dumps_bytes
 
 from recon_filter.engine.interfaces import FileProcessor, FileReader, OutputWriter
 from recon_filter.engine.handlers.text_handler import TextFileReader, TextOutputWriter
 from recon_filter.engine.handlers.json_handler import JsonFileReader, JsonOutputWriter
 from recon_filter.engine.handlers.csv_handler import CsvFileReader, CsvOutputWriter
-from recon_filter.engine.handlers.pdf_handler import PdfFileReader, PdfOutputWriter
+
+# Upper bound on simultaneously open cluster handles; colder clusters are suspended to avoid EMFILE
+MAX_OPEN_CLUSTER_WRITERS = 128
+# Output buffering shared by all open cluster writers, so grouped runs stay far below the memory sandbox
+CLUSTER_WRITE_BUDGET_BYTES = 8 << 20
+# Pending items per cluster writer before they are handed to its buffer
+CLUSTER_WRITE_BATCH_ITEMS = 64
 
 class EngineProcessor(FileProcessor):
     def __init__(self, file_path: Path, output_dir: Optional[Path], config: FilterConfig):
@@ -42,21 +53,28 @@ class EngineProcessor(FileProcessor):
                 risk_threshold=config.risk_threshold,
             )
         
-    def _resolve_strategy(self) -> Tuple[Type[FileReader], Type[OutputWriter]]:
+    def _resolve_strategy(self) -> Tuple[Type[FileReader], Callable[[Path, FilterConfig], OutputWriter]]:
         """Maps target extensions or force configs to strict parsing engines."""
         ext = self.file_path.suffix.lower()
         if self.config.force_format:
             ext = f".{self.config.force_format.strip('.')}"
             
         if ext == '.json':
-            return JsonFileReader, JsonOutputWriter
+            # JsonFileReader emits canonical JSON, so the paired writer can skip re-validation
+            return JsonFileReader, partial(JsonOutputWriter, trusted_json=True)
         elif ext == '.csv':
             return CsvFileReader, CsvOutputWriter
         elif ext == '.pdf':
+            # pypdf/pypdfium2 cost more to import than the rest of the CLI; only PDF runs pay for them
+            from recon_filter.engine.handlers.pdf_handler import PdfFileReader, PdfOutputWriter
             return PdfFileReader, PdfOutputWriter
         else:
             return TextFileReader, TextOutputWriter
 
+    def _hash(self, path: Path) -> str:
+        sample_mb = self.config.hash_sample_threshold_mb
+        return calculate_sha256(path, self.config.hash_algo, sample_mb * 1024 * 1024 if sample_mb is not None else None)
+
     def process(self) -> Dict[str, Any]:
         """Lifecycle Executor wrapper. Manages backups, checksums, sandboxes, cache bindings, and IO filters strictly."""
         validate_path_traversal(self.file_path)
@@ -66,9 +84,21 @@ class EngineProcessor(FileProcessor):
         timeout_deadline = start_time + self.config.timeout if self.config.timeout else None
         
         # 1. State integrity & Smart Caching
-        hash_pre = calculate_sha256(self.file_path)
+        # Preview/dry-run never persist cache state, so the pre-hash is only paid when someone consumes it
+        use_cache = self.config.enable_cache and not (self.config.preview or self.config.dry_run)
+        need_pre = use_cache or self.config.generate_hash_report
+        pending_hash = None
+        if need_pre and not use_cache:
+            # No cache decision rides on the digest, so the report hash runs in the background across the
+            # backup copy and the filter pass; hashing releases the GIL on large blocks
+            hash_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recon-filter-hash")
+            pending_hash = hash_pool.submit(self._hash, self.file_path)
+            hash_pool.shutdown(wait=False) # The submitted digest still completes; the worker exits after it
+            hash_pre = "disabled"
+        else:
+            hash_pre = self._hash(self.file_path) if need_pre else "disabled"
         
-        if self.cache.is_cached(self.file_path, hash_pre):
+        if use_cache and self.cache.is_cached(self.file_path, hash_pre):
             return {
                 "file": self.file_path.name,
                 "lines_scanned": 0,
@@ -83,7 +113,10 @@ class EngineProcessor(FileProcessor):
         
         # 2. Backups
         if not self.config.dry_run and not self.config.preview:
-            execute_backup(self.file_path, self.config.no_backup, self.config.backup_dir)
+            execute_backup(
+                self.file_path, self.config.no_backup, self.config.backup_dir,
+                preserve_metadata=not self.config.backup_content_only
+            )
 
         # 3. Output Resolution
         ReaderClass, WriterClass = self._resolve_strategy()
@@ -105,18 +138,28 @@ class EngineProcessor(FileProcessor):
         compiled_regex = RuleCompiler.compile_regex(
             self.config.regex_pattern, 
             self.config.case_sensitive, 
-            self.config.safe_mode
+            self.config.safe_mode,
+            self.config.use_re2
+        )
+        keyword_set = RuleCompiler.compile_keyword_set(
+            self.config.keywords,
+            self.config.exclude_keywords,
+            self.config.case_sensitive,
+            self.config.keyword_scores,
+            self.config.match_logic
         )
 
         lines_scanned = 0
         matches_found = 0
         unique_matches = 0
-        seen_hashes = set()
+        seen_hashes = set() # Scoped per file, so parallel workers never share dedupe state
         preview_buffer = []
         
         reader = ReaderClass(self.file_path, self.config)
         is_clustering = self.config.group_by_extension or self.config.group_by_depth
         active_writers: Dict[str, OutputWriter] = {}
+        open_clusters: "OrderedDict[str, None]" = OrderedDict()
+        header_line = getattr(reader, 'header_line', None)
         
         def _get_writer_for_cluster(chunk: str) -> OutputWriter:
             if not is_clustering:
@@ -130,16 +173,38 @@ class EngineProcessor(FileProcessor):
                 depth = self.url_analyzer.extract_depth(chunk)
                 cluster_key = f"depth_{depth}"
                 
-            if cluster_key not in active_writers:
+            writer = active_writers.get(cluster_key)
+            if writer is None:
                 c_dir = self.output_dir if self.output_dir else Path(".")
                 c_file = c_dir / f"{self.file_path.stem}_{cluster_key}{out_ext}"
-                new_writer = WriterClass(c_file, self.config)
-                new_writer.__enter__()
-                if hasattr(reader, 'headers') and getattr(reader, 'headers', None):
-                     new_writer.write(",".join(reader.headers))
-                active_writers[cluster_key] = new_writer
+                writer = WriterClass(c_file, self.config)
+                writer.buffer_bytes = max(io.DEFAULT_BUFFER_SIZE, CLUSTER_WRITE_BUDGET_BYTES // MAX_OPEN_CLUSTER_WRITERS)
+                writer.batch_items = CLUSTER_WRITE_BATCH_ITEMS
+                writer.__enter__()
+                if header_line:
+                     writer.write(header_line)
+                active_writers[cluster_key] = writer
+            elif cluster_key in open_clusters:
+                open_clusters.move_to_end(cluster_key)
+                return writer
+            else:
+                writer.resume()
                 
-            return active_writers[cluster_key]
+            open_clusters[cluster_key] = None
+            if len(open_clusters) > MAX_OPEN_CLUSTER_WRITERS:
+                lru_key, _ = open_clusters.popitem(last=False)
+                active_writers[lru_key].suspend()
+                
+            return writer
+        
+        # The intelligence overlay adds to the filter score, so only plain runs may stop scoring at min_score
+        need_full_score = self.intel_engine is not None
+        
+        # Keywords are fixed for the run, so the intelligence pass is specialized once up front
+        analyze_line = self.intel_engine.compile(self.config.keywords) if self.intel_engine else None
+        
+        # Resource sampling runs on a background thread, keeping it off the per-line path
+        self.perf_monitor.start()
         
         try:
             if self.config.preview:
@@ -148,62 +213,60 @@ class EngineProcessor(FileProcessor):
                 if hasattr(reader, 'headers') and getattr(reader, 'headers', None):
                     pass
                     
-                for idx, raw_chunk in enumerate(reader.read()):
-                    if idx % 1000 == 0:
-                        self.perf_monitor.heartbeat()
-                    
+                for raw_chunk in reader.read():
+                    # CSV rows arrive as CsvRow: parsed text to match, plus the source text to write
+                    source_row = raw_chunk if isinstance(raw_chunk, tuple) else None
+                    if source_row is not None:
+                        raw_chunk = source_row.text
                     if matches_found >= preview_limit:
                         break
                         
                     # Target URL validations natively
                     target_chunk = raw_chunk
-                    if isinstance(raw_chunk, str):
-                        is_valid_url, fixed_token = self.url_analyzer.analyze_token(str(raw_chunk))
-                        if not is_valid_url:
-                            continue # Strict URL filter drops this chunk
-                        if fixed_token:
-                            target_chunk = fixed_token
+                    is_valid_url, fixed_token = self.url_analyzer.analyze_token(raw_chunk)
+                    if not is_valid_url:
+                        continue # Strict URL filter drops this chunk
+                    if fixed_token:
+                        target_chunk = fixed_token
                         
-                    is_match, score = apply_filters(target_chunk, self.config, compiled_regex, deadline=timeout_deadline)
+                    is_match, score = apply_filters(target_chunk, self.config, compiled_regex, deadline=timeout_deadline, keyword_set=keyword_set, full_score=need_full_score)
                     lines_scanned += 1
                     
                     if is_match:
                         matches_found += 1
                         unique_matches += 1
-                        preview_buffer.append(target_chunk)
+                        preview_buffer.append(target_chunk if source_row is None or source_row.rewritten(target_chunk) else source_row.raw)
             else:
                 if not is_clustering:
                      default_w = WriterClass(out_file, self.config)
                      default_w.__enter__()
                      active_writers["default"] = default_w
-                     if hasattr(reader, 'headers') and getattr(reader, 'headers', None):
-                          default_w.write(",".join(reader.headers))
+                     if header_line:
+                          default_w.write(header_line)
 
-                for idx, raw_chunk in enumerate(reader.read()):
-                    if idx % 1000 == 0:
-                        self.perf_monitor.heartbeat()
-                        
+                for raw_chunk in reader.read():
+                    # CSV rows arrive as CsvRow: parsed text to match, plus the source text to write
+                    source_row = raw_chunk if isinstance(raw_chunk, tuple) else None
+                    if source_row is not None:
+                        raw_chunk = source_row.text
                     if self.config.match_limit and matches_found >= self.config.match_limit:
                         break
                         
                     # Target URL validations natively
                     target_chunk = raw_chunk
-                    if isinstance(raw_chunk, str):
-                        is_valid_url, fixed_token = self.url_analyzer.analyze_token(str(raw_chunk))
-                        if not is_valid_url:
-                            continue # Strict URL filter drops this chunk
-                        if fixed_token:
-                             target_chunk = fixed_token
+                    is_valid_url, fixed_token = self.url_analyzer.analyze_token(raw_chunk)
+                    if not is_valid_url:
+                        continue # Strict URL filter drops this chunk
+                    if fixed_token:
+                        target_chunk = fixed_token
 
-                    is_match, score = apply_filters(target_chunk, self.config, compiled_regex, deadline=timeout_deadline)
+                    is_match, score = apply_filters(target_chunk, self.config, compiled_regex, deadline=timeout_deadline, keyword_set=keyword_set, full_score=need_full_score)
                     lines_scanned += 1
 
                     # Intelligence engine overlay
                     risk_tag_str = ""
-                    if self.intel_engine and isinstance(target_chunk, str):
-                        intel_score, risk_tag_str, classification, intel_matched = self.intel_engine.analyze(
-                            target_chunk, self.config.keywords
-                        )
+                    if self.intel_engine:
+                        intel_score, risk_tag_str, classification, intel_matched = analyze_line(target_chunk)
                         score += intel_score
                         if intel_matched and not is_match:
                             is_match = True
@@ -213,7 +276,7 @@ class EngineProcessor(FileProcessor):
                     if is_match:
                         is_duplicate = False
                         if self.config.remove_duplicates:
-                            scope_target = str(target_chunk)
+                            scope_target = target_chunk
                             if self.config.dedupe_scope == 'normalized':
                                 scope_target = scope_target.strip().lower()
                             elif self.config.dedupe_scope == 'url-normalized':
@@ -233,13 +296,14 @@ class EngineProcessor(FileProcessor):
                         if not is_duplicate:
                             matches_found += 1
                             unique_matches += 1
-                            writer = _get_writer_for_cluster(str(target_chunk))
-                            writer.write(target_chunk)
+                            writer = _get_writer_for_cluster(target_chunk)
+                            writer.write(target_chunk if source_row is None else source_row.output(target_chunk))
                                 
         except PermissionError:
             # Traps graceful permission blocks returning strict exit code without stack traces
             raise RuntimeError(f"Permission Denied. Please elevate user access for {self.file_path.name}")
         finally:
+            self.perf_monitor.stop()
             # We explicitly trigger all active IO contextual teardowns ensuring atomic guarantees
             footer_lines = []
             if not self.config.no_footer and out_ext not in ['.json', '.csv']:
@@ -253,6 +317,7 @@ class EngineProcessor(FileProcessor):
                 ]
 
             for c_writer in active_writers.values():
+                c_writer.resume()
                 if footer_lines and matches_found > 0:
                      for fl in footer_lines:
                          c_writer.write(fl)
@@ -261,17 +326,19 @@ class EngineProcessor(FileProcessor):
                 
         # Handle Parameter Reports explicitly outside the cluster destructors
         if self.config.param_report or self.config.extract_params:
-             import json
              p_path = (self.output_dir if self.output_dir else Path(".")) / "parameters.json"
-             with p_path.open('w') as pf:
-                 json.dump(self.url_analyzer.generate_report(), pf, indent=4)
+             p_path.write_bytes(dumps_bytes(self.url_analyzer.generate_report(), pretty=True))
+
+        if pending_hash is not None:
+            hash_pre = pending_hash.result()
 
         # 6. Post state integrity
         if self.config.preview or self.config.dry_run:
             hash_post = "unmodified"
         else:
-            hash_post = calculate_sha256(out_file) if self.config.generate_hash_report else "disabled"
-            self.cache.update_cache(self.file_path, hash_pre)
+            hash_post = self._hash(out_file) if self.config.generate_hash_report else "disabled"
+            if use_cache:
+                self.cache.update_cache(self.file_path, hash_pre)
         
         # 7. Auditing logs
         self.audit.log_execution(self.file_path, self.config, unique_matches, hash_post)
@@ -3,14 +3,111 @@ Advanced Filtering Engine replacing old functionality with Security Hardened pro
 """
 import re
 import time
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Optional, NamedTuple, Sequence
 from recon_filter.config import FilterConfig
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+
+# A `re.Pattern`, or an RE2 pattern exposing the same search() API
+CompiledPattern = Any
+
+# Combination plans for the final verdict; MATCH_NONE means neither regex nor keywords are configured
+MATCH_NONE, MATCH_REGEX, MATCH_KEYWORDS, MATCH_ALL, MATCH_ANY = range(5)
+
+_COMBINE = (
+    None,
+    lambda regex, keyword: regex,
+    lambda regex, keyword: keyword,
+    lambda regex, keyword: regex and keyword,
+    lambda regex, keyword: regex or keyword,
+)
+
+
+def _resolve_match_mode(has_regex: bool, has_keywords: bool, match_logic: str) -> int:
+    if has_regex and has_keywords:
+        return MATCH_ALL if match_logic == "and" else MATCH_ANY
+    if has_regex:
+        return MATCH_REGEX
+    if has_keywords:
+        return MATCH_KEYWORDS
+    return MATCH_NONE
+
+
+class KeywordSet(NamedTuple):
+    """Pre-compiled keyword alternations scanned in a single C-level pass per line."""
+    include: Optional[re.Pattern]
+    exclude: Optional[re.Pattern]
+    # Keywords folded to the matching case once, aligned index-for-index with config.keywords
+    targets: Tuple[str, ...] = ()
+    # Aho-Corasick automaton over targets (pyahocorasick), reporting every keyword hit in one pass
+    automaton: Optional[object] = None
+    # True when no keyword score is negative, so a running OR score can only grow
+    monotonic_scores: bool = False
+    # How regex and keyword verdicts combine (MATCH_* constants), resolved once per run and
+    # indexed by whether a compiled regex is actually passed, so the two can never disagree
+    match_modes: Tuple[int, int] = (MATCH_NONE, MATCH_REGEX)
+
+
+def _compile_pattern(pattern: str, case_sensitive: bool, use_re2: bool = True) -> CompiledPattern:
+    """Compiles with RE2's linear-time engine when asked and installed, falling back to `re` for anything it rejects."""
+    if use_re2 and HAS_RE2:
+        try:
+            return re2.compile(pattern if case_sensitive else f"(?i){pattern}")
+        except Exception:
+            pass # Backreferences, lookaround and other backtracking-only syntax stay on the stdlib engine
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(pattern, flags=flags)
+
+@lru_cache(maxsize=64)
+def _compile_alternation(keywords: Tuple[str, ...], case_sensitive: bool) -> Optional[CompiledPattern]:
+    if not keywords:
+        return None
+    # Escaped literals mean the same thing on both engines, so RE2 is always used when installed
+    return _compile_pattern("|".join(map(re.escape, keywords)), case_sensitive)
+
+@lru_cache(maxsize=64)
+def _build_automaton(targets: Tuple[str, ...]):
+    if not HAS_AHOCORASICK:
+        return None
+    automaton = ahocorasick.Automaton()
+    for target in targets:
+        if target:
+            automaton.add_word(target, target)
+    if not len(automaton):
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+def _keyword_hits(target_line: str, keyword_set: KeywordSet):
+    """Set of targets present in the line via one automaton pass, or the line itself for plain `in` checks."""
+    if keyword_set.automaton is None:
+        return target_line
+    # The empty keyword is a substring of every line but cannot live in the automaton
+    hits = {""}
+    hits.update(target for _, target in keyword_set.automaton.iter(target_line))
+    return hits
+
 
 class RuleCompiler:
     """Safely compiles execution boundaries with Regex DoS protection bounds natively."""
     
     @staticmethod
-    def compile_regex(pattern: Optional[str], case_sensitive: bool, safe_mode: bool) -> Optional[re.Pattern]:
+    @lru_cache(maxsize=64)
+    def compile_regex(pattern: Optional[str], case_sensitive: bool, safe_mode: bool, use_re2: bool = False) -> Optional[CompiledPattern]:
+        # Memoized: every file in a run (and every worker task) shares one compiled pattern;
+        # RE2 has no internal cache like `re`, so a miss there means a full recompile.
+        # RE2 is opt-in for user patterns: its syntax and match semantics differ from `re` in corner cases
         if not pattern:
             return None
             
@@ -20,92 +117,117 @@ class RuleCompiler:
                 raise ValueError("Regex pattern violates Safe Mode complexity heuristics. Too many quantifiers.")
                 
         try:
-            flags = 0 if case_sensitive else re.IGNORECASE
-            return re.compile(pattern, flags=flags)
+            return _compile_pattern(pattern, case_sensitive, use_re2)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern '{pattern}': {e}")
 
+    @staticmethod
+    def compile_keyword_set(
+        keywords: Sequence[str],
+        exclude_keywords: Sequence[str],
+        case_sensitive: bool,
+        keyword_scores: Optional[Dict[str, int]] = None,
+        match_logic: str = "or"
+    ) -> KeywordSet:
+        """Builds IGNORECASE alternations so matching never allocates a lowercased copy of the line."""
+        targets = tuple(keywords) if case_sensitive else tuple(kw.lower() for kw in keywords)
+        return KeywordSet(
+            include=_compile_alternation(tuple(keywords), case_sensitive),
+            exclude=_compile_alternation(tuple(exclude_keywords), case_sensitive),
+            targets=targets,
+            automaton=_build_automaton(targets),
+            monotonic_scores=all(v >= 0 for v in (keyword_scores or {}).values()),
+            match_modes=(
+                _resolve_match_mode(False, bool(keywords), match_logic),
+                _resolve_match_mode(True, bool(keywords), match_logic),
+            ),
+        )
+
 
 def apply_filters(
     line: str, 
     config: FilterConfig, 
-    compiled_regex: Optional[re.Pattern] = None,
-    deadline: Optional[float] = None
+    compiled_regex: Optional[CompiledPattern] = None,
+    deadline: Optional[float] = None,
+    keyword_set: Optional[KeywordSet] = None,
+    full_score: bool = True
 ) -> Tuple[bool, int]:
     """
     Applies the configured advanced enterprise filters to a string chunk.
     Enforces Negative Filtering, Thresholds, and Timeout bounds dynamically.
+    With full_score=False, scored OR matching stops once min_score is reached, so the
+    returned score is only guaranteed to be >= min_score rather than the full sum.
     """
     # 0. Timeout Bound Execution
     if deadline and time.time() > deadline:
         raise TimeoutError("Execution exceeded configured timeout bound limits.")
 
+    if keyword_set is None:
+        keyword_set = RuleCompiler.compile_keyword_set(
+            config.keywords, config.exclude_keywords, config.case_sensitive,
+            config.keyword_scores, config.match_logic
+        )
+
     original_line = line
     
     # 1. Negative Filtering (Immediate Rejection)
-    if config.exclude_keywords:
-        target_eval = original_line if config.case_sensitive else original_line.lower()
-        for neg_kw in config.exclude_keywords:
-            kw_eval = neg_kw if config.case_sensitive else neg_kw.lower()
-            if kw_eval in target_eval:
-                return False, 0
+    if keyword_set.exclude is not None and keyword_set.exclude.search(original_line):
+        return False, 0
                 
     # 2. Length Validations (Fast abort)
-    if config.min_length > 0 and len(original_line) < config.min_length:
-        return False, 0
-    if config.max_length is not None and len(original_line) > config.max_length:
-        return False, 0
+    min_length = config.min_length
+    max_length = config.max_length
+    if min_length > 0 or max_length is not None:
+        line_length = len(original_line)
+        if line_length < min_length or (max_length is not None and line_length > max_length):
+            return False, 0
 
-    target_line = original_line if config.case_sensitive else original_line.lower()
-    
     score = 0
-    matches_regex = False
+    min_score = config.min_score
     
     # 3. Regex Processing
-    if compiled_regex:
-        if compiled_regex.search(original_line):
-            matches_regex = True
+    matches_regex = compiled_regex is not None and compiled_regex.search(original_line) is not None
             
     # 4. Keyword Processing & Scoring
     matches_keyword = False
     if config.keywords:
         if config.match_logic == "and":
+            target_line = original_line if config.case_sensitive else original_line.lower()
+            hits = _keyword_hits(target_line, keyword_set)
+            score_of = config.keyword_scores.get
             matches_keyword = True
-            for kw in config.keywords:
-                kw_target = kw if config.case_sensitive else kw.lower()
-                if kw_target in target_line:
-                    score += config.keyword_scores.get(kw, 0)
+            for kw, kw_target in zip(config.keywords, keyword_set.targets):
+                if kw_target in hits:
+                    score += score_of(kw, 0)
                 else:
                     matches_keyword = False
                     break
-        else:
-            # OR Logic
-            for kw in config.keywords:
-                kw_target = kw if config.case_sensitive else kw.lower()
-                if kw_target in target_line:
+        elif config.keyword_scores:
+            # OR Logic with per-keyword scoring needs every individual hit
+            target_line = original_line if config.case_sensitive else original_line.lower()
+            hits = _keyword_hits(target_line, keyword_set)
+            score_of = config.keyword_scores.get
+            stop_at = min_score if (min_score > 0 and not full_score and keyword_set.monotonic_scores) else None
+            for kw, kw_target in zip(config.keywords, keyword_set.targets):
+                if kw_target in hits:
                     matches_keyword = True
-                    score += config.keyword_scores.get(kw, 0)
+                    score += score_of(kw, 0)
+                    if stop_at is not None and score >= stop_at:
+                        # Outcome is settled; remaining keywords could only add to the score
+                        break
+        else:
+            # OR Logic without scores only needs to know whether any keyword occurs
+            matches_keyword = keyword_set.include.search(original_line) is not None
 
     # 5. Auto Detection Defaults (If user specified NEITHER regex nor keywords, everything matches vacuously unless negative failed)
-    if not config.keywords and not config.regex_pattern:
-        return score >= config.min_score, score
-
-    is_match = False
-    has_regex = bool(config.regex_pattern)
-    has_keywords = bool(config.keywords)
-
-    if config.match_logic == "and":
-        if has_regex and has_keywords:
-            is_match = matches_regex and matches_keyword
-        elif has_regex:
-            is_match = matches_regex
-        elif has_keywords:
-            is_match = matches_keyword
-    else:
-        is_match = matches_regex or matches_keyword
+    match_mode = keyword_set.match_modes[compiled_regex is not None]
+    if match_mode == MATCH_NONE:
+        return score >= min_score, score
+
+    is_match = _COMBINE[match_mode](matches_regex, matches_keyword)
 
     # 6. Score Threshold Filter
-    if is_match and config.min_score > 0 and score < config.min_score:
+    if is_match and min_score > 0 and score < min_score:
         is_match = False
 
     return is_match, score
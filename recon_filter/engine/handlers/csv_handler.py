@@ -3,35 +3,72 @@ CSV preservation layer keeping rows/column mappings intact natively.
 """
 import csv
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, List, NamedTuple, Sequence, Tuple, Union
 
 from recon_filter.config import FilterConfig
 from recon_filter.engine.interfaces import FileReader, OutputWriter
 
+class CsvRow(NamedTuple):
+    """A CSV row as matched (joined fields) and as read (escaped source text)."""
+    text: str
+    raw: str
+    fields: Tuple[str, ...]
+
+    def rewritten(self, final_text: str) -> bool:
+        # analyze_token strips the line and may prepend a scheme; only the prefix is a real rewrite
+        return final_text != self.text and final_text != self.text.strip()
+
+    def output(self, final_text: str) -> Union[str, List[str]]:
+        """Source text when URL normalization left the row alone, else the fields with the rewrite applied."""
+        if not self.rewritten(final_text):
+            return self.raw
+        stripped = self.text.strip()
+        if not self.fields or not final_text.endswith(stripped):
+            return [final_text]
+        # The added prefix belongs to the first field; the outer strip to the first and last fields
+        fields = list(self.fields)
+        fields[-1] = fields[-1].rstrip()
+        fields[0] = final_text[:len(final_text) - len(stripped)] + fields[0].lstrip()
+        return fields
+
 class CsvFileReader(FileReader):
     def __init__(self, filepath: Path, config: FilterConfig):
         super().__init__(filepath, config)
         self.headers = None
+        self.header_line = None
         # Extract headers natively to prevent generator delay hooks
-        with self.filepath.open('r', encoding=self.config.encoding or 'utf-8') as f:
-            reader = csv.reader(f)
-            try:
-                self.headers = next(reader)
-            except StopIteration:
-                pass
+        with self.filepath.open('r', encoding=self.config.encoding or 'utf-8', newline='') as f:
+            for row, raw in self._iter_raw_rows(f):
+                self.headers = row
+                self.header_line = raw
+                break
+
+    @staticmethod
+    def _iter_raw_rows(f) -> Iterator[Tuple[List[str], str]]:
+        """Pairs each parsed row with the exact source text csv consumed for it."""
+        consumed = []
+
+        def _tracked_lines():
+            # Records the physical lines csv consumes so each row can be forwarded verbatim
+            for line in f:
+                consumed.append(line)
+                yield line
+
+        for row in csv.reader(_tracked_lines()):
+            raw = "".join(consumed).rstrip('\r\n')
+            consumed.clear()
+            yield row, raw
         
-    def read(self) -> Iterator[str]:
-        with self.filepath.open('r', encoding=self.config.encoding or 'utf-8') as f:
-            reader = csv.reader(f)
-            try:
-                # Skip the identical header from iteration
-                next(reader)
-            except StopIteration:
-                pass
+    def read(self) -> Iterator[CsvRow]:
+        with self.filepath.open('r', encoding=self.config.encoding or 'utf-8', newline='') as f:
+            rows = self._iter_raw_rows(f)
+            # Skip the identical header from iteration
+            next(rows, None)
                 
-            for row in reader:
-                # Process row identically to log string sequence incrementally
-                yield ",".join(row)
+            for row, raw in rows:
+                # Filter on the parsed fields; the already-escaped source text is what gets written,
+                # so quoted commas survive the round trip
+                yield CsvRow(",".join(row), raw, tuple(row))
 
 class CsvOutputWriter(OutputWriter):
     def __init__(self, filepath: Path, config: FilterConfig):
@@ -42,16 +79,22 @@ class CsvOutputWriter(OutputWriter):
         
     def __enter__(self):
         if not self.config.dry_run and not self.config.preview:
-            self.file = open(self.atomic_path, 'w', newline='', encoding=self.config.encoding or 'utf-8')
-            self.writer = csv.writer(self.file)
+            self._open_atomic('w')
         return self
+
+    def _open_atomic(self, mode: str) -> None:
+        self.file = open(self.atomic_path, mode, newline='', encoding=self.config.encoding or 'utf-8')
+        self.writer = csv.writer(self.file)
         
     def _close_file(self):
         if self.file:
             self.file.close()
             self.success = True
             
-    def write(self, item: str) -> None:
+    def write(self, item: Union[str, Sequence[str]]) -> None:
         if self.writer:
-            row = item.split(",")
-            self.writer.writerow(row)
+            if isinstance(item, str):
+                # Pre-escaped row text from CsvFileReader, no split/re-quote pass required
+                self.file.write(item + self.writer.dialect.lineterminator)
+            else:
+                self.writer.writerow(item)
@@ -2,66 +2,81 @@
 JSON format preservation utilizing iterative JSON parsing (`ijson`) yielding extreme memory efficiency.
 """
 import json
+import mmap
 import ijson
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Iterator, Any
+from typing import Iterator
 
 from recon_filter.config import FilterConfig
 from recon_filter.engine.interfaces import FileReader, OutputWriter
+from recon_filter.engine.serialization import dumps, loads
+
+# First characters a serialized JSON value can start with: object, array, string (the usual
+# shape of recon URL lists), number, true/false/null
+_JSON_VALUE_STARTS = frozenset(('{', '[', '"', '-', *'0123456789', 't', 'f', 'n'))
 
 class JsonFileReader(FileReader):
     def __init__(self, filepath: Path, config: FilterConfig):
         super().__init__(filepath, config)
         
-    def read(self) -> Iterator[Any]:
+    def read(self) -> Iterator[str]:
         # Employs `ijson.items` to iteratively parse large JSON arrays/dicts yielding structures
         # lazily rather than loading multi-GB objects into RAM.
-        with self.filepath.open('rb') as f:
+        with self.filepath.open('rb') as f, self._map_input(f) as source:
             try:
-                # First, infer if it's an array or top-level dictionary
-                parser = ijson.parse(f)
-                prefix_type = None
-                for prefix, event, value in parser:
-                    if event == 'start_array':
-                        prefix_type = 'array'
-                        break
-                    elif event == 'start_map':
-                        prefix_type = 'map'
-                        break
-                        
-                f.seek(0)
+                # Sniff the root container from the first non-whitespace byte instead of bootstrapping a parser
+                is_array = source.read(512).lstrip().startswith(b'[')
+                source.seek(0)
                         
-                if prefix_type == 'array':
+                if is_array:
                     # Parse each array object natively
-                    objects = ijson.items(f, 'item')
+                    objects = ijson.items(source, 'item', use_float=True)
                     for obj in objects:
-                        yield json.dumps(obj)
+                        yield dumps(obj)
                 else:
                     # Treat root maps by iteratively parsing top-level string keys natively
-                    kv_pairs = ijson.kvitems(f, '')
+                    kv_pairs = ijson.kvitems(source, '', use_float=True)
                     for k, v in kv_pairs:
-                        yield json.dumps({k: v})
+                        yield dumps({k: v})
 
             except (ijson.JSONError, ValueError) as e:
                 raise ValueError(f"JSON Iterative validation failed on {self.filepath.name}: {e}")
 
+    @staticmethod
+    def _map_input(f):
+        # Paging is left to the OS so ijson's reads are memcpys rather than read syscalls
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files cannot be mapped; plain buffered reads still work
+            return nullcontext(f)
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        return mm
+
 
 class JsonOutputWriter(OutputWriter):
-    def __init__(self, filepath: Path, config: FilterConfig):
+    def __init__(self, filepath: Path, config: FilterConfig, trusted_json: bool = False):
         super().__init__(filepath, config)
         self.file = None
         self.first_item = True
+        self.trusted_json = trusted_json
         
     def __enter__(self):
         if not self.config.dry_run and not self.config.preview:
             # Atomic Target is used
-            self.file = open(self.atomic_path, 'w', encoding=self.config.encoding or 'utf-8')
+            self._open_atomic('w')
             if not self.config.append_mode:
                 self.file.write("[\n")
         return self
+
+    def _open_atomic(self, mode: str) -> None:
+        self.file = open(self.atomic_path, mode, encoding=self.config.encoding or 'utf-8', buffering=self.buffer_bytes)
         
     def _close_file(self):
         if self.file:
+            self._flush_pending()
             if not self.config.append_mode:
                 self.file.write("\n]\n")
             self.file.close()
@@ -69,11 +84,16 @@ class JsonOutputWriter(OutputWriter):
             
     def write(self, item: str) -> None:
         if self.file:
-            prefix = "  " if self.first_item else ",\n  "
+            self._buffered_write("  " if self.first_item else ",\n  ")
+            self.first_item = False
+            if self.trusted_json and item[:1] in _JSON_VALUE_STARTS:
+                # Items from JsonFileReader are already canonical JSON; the leading-byte guard
+                # only diverts lines that URL normalization rewrote (e.g. an added scheme)
+                self._buffered_write(item)
+                return
             try:
-                valid_struct = json.loads(item)
-                self.file.write(f'{prefix}{json.dumps(valid_struct, indent=None)}')
+                # Validation only; valid items are already compact JSON from the reader and are written verbatim
+                loads(item)
+                self._buffered_write(item)
             except json.JSONDecodeError:
-                self.file.write(f'{prefix}{json.dumps(item)}')
-                
-            self.first_item = False
+                self._buffered_write(dumps(item))
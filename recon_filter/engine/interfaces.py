@@ -10,6 +10,47 @@ import shutil
 
 from recon_filter.config import FilterConfig
 
+# Pending writes are handed to the OS layer in batches of this many items
+WRITE_BATCH_ITEMS = 1024
+# Userland buffer size for output handles opened by the writers
+WRITE_BUFFER_BYTES = 1024 * 1024
+
+
+def _append_file(src: Path, dst: Path) -> None:
+    """Appends src onto dst, copying in-kernel via copy_file_range/sendfile where the platform allows."""
+    # Neither syscall accepts an O_APPEND target, so dst is opened r+b and written at explicit offsets
+    with src.open('rb') as fin, dst.open('r+b') as fout:
+        in_fd, out_fd = fin.fileno(), fout.fileno()
+        size = os.fstat(in_fd).st_size
+        base = fout.seek(0, os.SEEK_END)
+        copied = 0
+
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while copied < size:
+                    n = os.copy_file_range(in_fd, out_fd, size - copied, copied, base + copied)
+                    if not n:
+                        break
+                    copied += n
+            except OSError:
+                pass
+
+        if copied < size and hasattr(os, 'sendfile'):
+            try:
+                os.lseek(out_fd, base + copied, os.SEEK_SET)
+                while copied < size:
+                    n = os.sendfile(out_fd, in_fd, copied, size - copied)
+                    if not n:
+                        break
+                    copied += n
+            except OSError:
+                pass
+
+        if copied < size:
+            fin.seek(copied)
+            fout.seek(base + copied)
+            shutil.copyfileobj(fin, fout)
+
 
 class FileReader(ABC):
     """Strategy for parsing raw inputs into processable entities (lines/rows)."""
@@ -21,7 +62,11 @@ class FileReader(ABC):
 
     @abstractmethod
     def read(self) -> Iterator[Any]:
-        """Yields raw parsed chunks suitable for the FilterEngine natively as generators."""
+        """
+        Yields raw parsed chunks as `str` suitable for the FilterEngine natively as generators.
+        A reader may yield a tuple instead (see CsvRow): `.text` is filtered, and
+        `.output(final_text)` is what gets written once URL normalization has run.
+        """
         pass
 
 
@@ -33,6 +78,11 @@ class OutputWriter(ABC):
         self.config = config
         self.atomic_path = Path(f"{filepath}.tmp")
         self.success = False
+        self.suspended = False
+        self._pending = []
+        # Per-writer buffering; pooled cluster writers are given a share of a fixed budget instead
+        self.buffer_bytes = WRITE_BUFFER_BYTES
+        self.batch_items = WRITE_BATCH_ITEMS
 
     @abstractmethod
     def __enter__(self):
@@ -55,8 +105,7 @@ class OutputWriter(ABC):
             if self.atomic_path.exists():
                 if self.config.append_mode and self.filepath.exists():
                     # If append mode natively, we concatenate the tmp file safely into target
-                    with self.filepath.open('ab') as target, self.atomic_path.open('rb') as tmp:
-                        shutil.copyfileobj(tmp, target)
+                    _append_file(self.atomic_path, self.filepath)
                     self.atomic_path.unlink()
                 else:
                     os.replace(self.atomic_path, self.filepath)
@@ -65,6 +114,37 @@ class OutputWriter(ABC):
             if self.atomic_path.exists():
                 self.atomic_path.unlink()
                 
+    @abstractmethod
+    def _open_atomic(self, mode: str) -> None:
+        """Child classes must open self.atomic_path with the given base mode ('w' or 'a') binding self.file."""
+        pass
+
+    def _buffered_write(self, chunk) -> None:
+        """Queues an encoded chunk, handing the whole batch to one writelines call when full."""
+        self._pending.append(chunk)
+        if len(self._pending) >= self.batch_items:
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        if self._pending:
+            if getattr(self, 'file', None) is not None:
+                self.file.writelines(self._pending)
+            self._pending.clear()
+
+    def suspend(self) -> None:
+        """Releases the OS handle mid-run without committing, letting callers pool open writers."""
+        if getattr(self, 'file', None) is not None:
+            self._flush_pending()
+            self.file.close()
+            self.file = None
+            self.suspended = True
+
+    def resume(self) -> None:
+        """Re-opens a suspended atomic fragment in append mode, continuing where it left off."""
+        if self.suspended:
+            self._open_atomic('a')
+            self.suspended = False
+
     @abstractmethod
     def _close_file(self):
         """Child classes must override to close the open handle safely."""
@@ -2,6 +2,14 @@
 Adaptive internal monitors tracking Resource thresholds flushing flows defensively.
 """
 import os
+import sys
+import threading
+import time
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    HAS_RESOURCE = False
 try:
     import psutil
     HAS_PSUTIL = True
@@ -9,6 +17,12 @@ except ImportError:
     HAS_PSUTIL = False
 from typing import Dict, Any
 
+# Seconds between background samples
+SAMPLE_INTERVAL_SECONDS = 0.1
+
+# ru_maxrss is reported in bytes on macOS and KiB elsewhere
+_MAXRSS_SCALE = 1 if sys.platform == "darwin" else 1024
+
 class PerformanceMonitor:
     def __init__(self, memory_limit_mb: int = None):
         if HAS_PSUTIL:
@@ -23,22 +37,63 @@ class PerformanceMonitor:
                 
         self.peak_memory = 0
         self.cpu_samples = []
+        self._stop_event = threading.Event()
+        self._sampler = None
+        self._last_cpu = None
+
+    def start(self) -> None:
+        """Launches the background sampler; a no-op without psutil or when already running."""
+        if not HAS_PSUTIL or self._sampler is not None:
+            return
+        self._stop_event.clear()
+        self._last_cpu = self._cpu_clock()
+        self._sampler = threading.Thread(target=self._run_sampler, name="recon-filter-monitor", daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """Stops the sampler and records a closing sample so short runs still report."""
+        if self._sampler is None:
+            return
+        self._stop_event.set()
+        self._sampler.join()
+        self._sampler = None
+        self.heartbeat()
+
+    def _run_sampler(self) -> None:
+        while not self._stop_event.wait(SAMPLE_INTERVAL_SECONDS):
+            self.heartbeat()
+
+    @staticmethod
+    def _cpu_clock():
+        # os.times() gives user+system CPU seconds without touching /proc
+        t = os.times()
+        return t.user + t.system, time.monotonic()
     
     def heartbeat(self):
-        """Samples current constraints pushing GC if limits crossed."""
-        # Note: calling this per line is slow, so it should be called every X chunks
+        """Samples current constraints pushing GC if limits crossed. Driven by the sampler thread."""
         if not HAS_PSUTIL:
             return
-        mem_info = self.process.memory_info().rss
-        if mem_info > self.peak_memory:
-            self.peak_memory = mem_info
+        if HAS_RESOURCE:
+            # Kernel-maintained high-water mark; no /proc read needed
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_SCALE
+        else:
+            peak = self.process.memory_info().rss
+        if peak > self.peak_memory:
+            self.peak_memory = peak
             
-        self.cpu_samples.append(self.process.cpu_percent())
+        if self._last_cpu is not None:
+            cpu, wall = self._cpu_clock()
+            prev_cpu, prev_wall = self._last_cpu
+            if wall > prev_wall:
+                self.cpu_samples.append((cpu - prev_cpu) / (wall - prev_wall) * 100)
+            self._last_cpu = (cpu, wall)
         
-        if self.memory_limit_bytes and mem_info > self.memory_limit_bytes:
-            # Force generational purge natively 
-            import gc
-            gc.collect()
+        # Current RSS can only exceed the limit once the peak has, so psutil is consulted only past that point
+        if self.memory_limit_bytes and peak > self.memory_limit_bytes:
+            if self.process.memory_info().rss > self.memory_limit_bytes:
+                # Force generational purge natively 
+                import gc
+                gc.collect()
             
     def generate_report(self) -> Dict[str, Any]:
         """Maps output analytics for the final diagnostics."""
@@ -0,0 +1,34 @@
+"""
+JSON serialization shim preferring the `orjson` C encoder when installed, falling back to stdlib `json`.
+"""
+import json
+from typing import Any
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps_bytes(obj: Any, pretty: bool = False) -> bytes:
+    """Serializes obj to UTF-8 JSON bytes. Pretty output uses a 2-space indent on both backends."""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False).encode('utf-8')
+
+
+def dumps(obj: Any) -> str:
+    """Serializes obj to a compact JSON string."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def loads(data: Any) -> Any:
+    """Parses JSON text or bytes. Raises json.JSONDecodeError on both backends."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,9 +2,23 @@
 Intelligence Engine v2 — Risk-based scoring, endpoint heuristics,
 fuzzy matching, and automatic threat tagging for reconnaissance data.
 """
+import re
+import sys
+from bisect import bisect_right
 from difflib import SequenceMatcher
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
+try:
+    from rapidfuzz import fuzz, process as rf_process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 # ------------------------------------------------------------------ #
 #  Risk Weight Tables
@@ -43,17 +57,35 @@ API_PATTERNS = ["/api/", "/v1/", "/v2/", "/v3/", "/graphql", "/rest/", "/rpc/",
 BACKUP_EXTENSIONS = [".bak", ".old", ".sql", ".dump", ".gz", ".tar", ".zip", ".sql.gz", ".backup"]
 DEV_PATTERNS = ["/staging", "/dev", "/test", "/debug", "/beta", "/sandbox", "/internal"]
 
+# Each category fused into one alternation so a heuristic costs a single C-level scan
+_ADMIN_RE = re.compile("|".join(map(re.escape, ADMIN_PATTERNS)))
+_API_RE = re.compile("|".join(map(re.escape, API_PATTERNS)))
+_DEV_RE = re.compile("|".join(map(re.escape, DEV_PATTERNS)))
+_BACKUP_SUFFIXES = tuple(BACKUP_EXTENSIONS)
+
+# URL delimiters plus whitespace, matching the old replace-then-split tokenization in one pass
+_TOKEN_SPLIT_RE = re.compile(r"[/?&=\s]+")
+
+@lru_cache(maxsize=65536)
+def _char_mask(s: str) -> int:
+    """64-bit character-presence mask; folded collisions only ever let extra pairs through."""
+    mask = 0
+    for c in s:
+        mask |= 1 << (ord(c) & 63)
+    return mask
+
 # ------------------------------------------------------------------ #
 #  Risk Tags
 # ------------------------------------------------------------------ #
 
+# Lower bounds of [MEDIUM] and [HIGH]; bisect_right maps a score straight to its tag index
+_TAG_THRESHOLDS = (8, 15)
+_TAGS = ("[LOW]", "[MEDIUM]", "[HIGH]")
+
+
 def risk_tag(score: int) -> str:
     """Return a risk label based on score thresholds."""
-    if score >= 15:
-        return "[HIGH]"
-    elif score >= 8:
-        return "[MEDIUM]"
-    return "[LOW]"
+    return _TAGS[bisect_right(_TAG_THRESHOLDS, score)]
 
 
 # ------------------------------------------------------------------ #
@@ -74,8 +106,21 @@ class IntelligenceEngine:
         risk_threshold: int = 0,
     ):
         self.fuzzy_threshold = fuzzy_threshold
+        self._fuzzy_cutoff = fuzzy_threshold * 100
         self.risk_threshold = risk_threshold
 
+        # Recon dumps repeat hosts and path segments constantly, so (keyword, token) verdicts are memoized per engine
+        self._is_similar = lru_cache(maxsize=65536)(self._similarity_passes)
+        # Shared fallback matcher; autojunk only affects sequences of 200+ items, never recon tokens
+        self._matcher = SequenceMatcher(None, autojunk=False)
+
+        # Aho-Corasick automaton over the runtime keyword list, rebuilt only when a different list is passed
+        self._ac = None
+        self._ac_source: Optional[List[str]] = None
+        # Per-keyword (original, lowered, exact weight, fuzzy weight) rows, cached the same way
+        self._scored: Tuple[Tuple[str, str, int, int], ...] = ()
+        self._scored_source: Optional[List[str]] = None
+
         self.weights: Dict[str, int] = dict(KEYWORD_WEIGHTS)
         if priority_keywords:
             for kw in priority_keywords:
@@ -93,21 +138,48 @@ class IntelligenceEngine:
         score = 0
         matched: List[str] = []
 
+        # Lowercased and stripped views are derived once and shared by every sub-scorer
+        line_lower = line.lower()
+        stripped = line.strip()
+
         # 1. Keyword scoring (exact + fuzzy)
-        kw_score, kw_matched = self._keyword_score(line, keywords)
+        kw_score, kw_matched = self._keyword_score(line_lower, keywords)
         score += kw_score
         matched.extend(kw_matched)
 
         # 2. URL / extension / parameter analysis
-        classification = self._classify(line)
-        score += self._structural_score(line, classification)
+        classification = self._classify(stripped)
+        score += self._structural_score(stripped, classification)
 
         # 3. Endpoint heuristics
-        score += self._heuristic_score(line)
+        score += self._heuristic_score(line_lower)
 
         tag = risk_tag(score)
         return score, tag, classification, matched
 
+    def compile(self, keywords: List[str]) -> Callable[[str], Tuple[int, str, str, List[str]]]:
+        """
+        Specialize analyze() for a keyword list that stays fixed across a run.
+        The automaton, weight rows and scorer lookups are resolved once and closed over,
+        so each call only does the per-line work.
+        """
+        rows = self._scored_keywords(keywords)
+        automaton = self._keyword_automaton(keywords) if HAS_AHOCORASICK else None
+        score_rows = self._score_keyword_rows
+        classify = self._classify
+        structural_score = self._structural_score
+        heuristic_score = self._heuristic_score
+
+        def analyze_line(line: str) -> Tuple[int, str, str, List[str]]:
+            line_lower = line.lower()
+            stripped = line.strip()
+            score, matched = score_rows(line_lower, rows, automaton)
+            classification = classify(stripped)
+            score += structural_score(stripped, classification) + heuristic_score(line_lower)
+            return score, risk_tag(score), classification, matched
+
+        return analyze_line
+
     def passes_threshold(self, score: int) -> bool:
         """Check if a score meets the configured risk threshold."""
         return score >= self.risk_threshold
@@ -116,40 +188,96 @@ class IntelligenceEngine:
     #  Keyword Scoring
     # ------------------------------------------------------------------ #
 
-    def _keyword_score(self, line: str, keywords: List[str]) -> Tuple[int, List[str]]:
-        line_lower = line.lower()
+    def _keyword_automaton(self, keywords: List[str]):
+        # Identity check keeps the per-line cost O(1); the engine passes the same config list every line
+        if keywords is not self._ac_source:
+            automaton = ahocorasick.Automaton()
+            for kw in keywords:
+                kw_lower = kw.lower()
+                if kw_lower:
+                    automaton.add_word(kw_lower, kw_lower)
+            if len(automaton):
+                automaton.make_automaton()
+                self._ac = automaton
+            else:
+                self._ac = None
+            self._ac_source = keywords
+        return self._ac
+
+    def _scored_keywords(self, keywords: List[str]) -> Tuple[Tuple[str, str, int, int], ...]:
+        if keywords is not self._scored_source:
+            rows = []
+            for kw in keywords:
+                kw_lower = sys.intern(kw.lower())
+                weight = self.weights.get(kw_lower, 1)
+                rows.append((kw, kw_lower, weight, max(1, int(weight * 0.6))))
+            self._scored = tuple(rows)
+            self._scored_source = keywords
+        return self._scored
+
+    def _keyword_score(self, line_lower: str, keywords: List[str]) -> Tuple[int, List[str]]:
+        automaton = self._keyword_automaton(keywords) if HAS_AHOCORASICK else None
+        return self._score_keyword_rows(line_lower, self._scored_keywords(keywords), automaton)
+
+    def _score_keyword_rows(self, line_lower: str, rows: Tuple[Tuple[str, str, int, int], ...], automaton) -> Tuple[int, List[str]]:
         total = 0
         matched: List[str] = []
 
-        for kw in keywords:
-            kw_lower = kw.lower()
-            weight = self.weights.get(kw_lower, 1)
+        found = None
+        if automaton is not None:
+            # One O(N + hits) pass over the line instead of one substring scan per keyword
+            found = {kw_lower for _, kw_lower in automaton.iter(line_lower)}
+
+        tokens: Optional[List[str]] = None
+        for kw, kw_lower, weight, fuzzy_weight in rows:
+            hit = kw_lower in found if found is not None else kw_lower in line_lower
 
-            if kw_lower in line_lower:
+            if hit:
                 total += weight
                 matched.append(kw)
-            elif self._fuzzy_match(kw_lower, line_lower):
-                total += max(1, int(weight * 0.6))
+                continue
+
+            if tokens is None:
+                # Tokenized once per line, and only if some keyword actually reaches the fuzzy path
+                tokens = [token for token in _TOKEN_SPLIT_RE.split(line_lower) if len(token) >= 2]
+            if self._fuzzy_match(kw_lower, tokens):
+                total += fuzzy_weight
                 matched.append(f"{kw}~")
 
         return total, matched
 
-    def _fuzzy_match(self, keyword: str, text: str) -> bool:
-        tokens = text.replace("/", " ").replace("?", " ").replace("&", " ").replace("=", " ").split()
+    def _fuzzy_match(self, keyword: str, tokens: List[str]) -> bool:
+        if HAS_RAPIDFUZZ:
+            # Single C-level scan over every token; score_cutoff lets rapidfuzz bail out early per pair
+            return rf_process.extractOne(keyword, tokens, scorer=fuzz.ratio, score_cutoff=self._fuzzy_cutoff) is not None
+        threshold = self.fuzzy_threshold
+        kl = len(keyword)
+        kw_mask = _char_mask(keyword)
         for token in tokens:
-            if len(token) < 2:
+            # ratio() is 2*M/(la+lb) with M <= min(la, lb), so the same expression with M = min
+            # is an exact upper bound; disjoint character masks mean M == 0
+            tl = len(token)
+            if 2.0 * min(kl, tl) / (kl + tl) < threshold:
+                continue
+            if not kw_mask & _char_mask(token) and threshold > 0:
                 continue
-            if SequenceMatcher(None, keyword, token).ratio() >= self.fuzzy_threshold:
+            if self._is_similar(keyword, token):
                 return True
         return False
 
+    def _similarity_passes(self, keyword: str, token: str) -> bool:
+        # The keyword sits in seq2, whose b2j index set_seq2 only rebuilds when the keyword changes
+        sm = self._matcher
+        sm.set_seq2(keyword)
+        sm.set_seq1(token)
+        return sm.ratio() >= self.fuzzy_threshold
+
     # ------------------------------------------------------------------ #
     #  Classification
     # ------------------------------------------------------------------ #
 
     @staticmethod
-    def _classify(line: str) -> str:
-        s = line.strip()
+    def _classify(s: str) -> str:
         if "://" in s or s.startswith("www."):
             return "url"
         if s.startswith("/") and not s.startswith("//"):
@@ -162,9 +290,8 @@ class IntelligenceEngine:
     #  Structural Scoring
     # ------------------------------------------------------------------ #
 
-    def _structural_score(self, line: str, classification: str) -> int:
+    def _structural_score(self, stripped: str, classification: str) -> int:
         score = 0
-        stripped = line.strip()
 
         if classification == "url":
             try:
@@ -205,29 +332,20 @@ class IntelligenceEngine:
     # ------------------------------------------------------------------ #
 
     @staticmethod
-    def _heuristic_score(line: str) -> int:
-        lower = line.lower()
+    def _heuristic_score(lower: str) -> int:
         score = 0
 
-        for pattern in ADMIN_PATTERNS:
-            if pattern in lower:
-                score += 6
-                break
-
-        for pattern in API_PATTERNS:
-            if pattern in lower:
-                score += 4
-                break
-
-        for ext in BACKUP_EXTENSIONS:
-            if lower.endswith(ext):
-                score += 5
-                break
-
-        for pattern in DEV_PATTERNS:
-            if pattern in lower:
-                score += 3
-                break
+        if _ADMIN_RE.search(lower):
+            score += 6
+
+        if _API_RE.search(lower):
+            score += 4
+
+        if lower.endswith(_BACKUP_SUFFIXES):
+            score += 5
+
+        if _DEV_RE.search(lower):
+            score += 3
 
         return score
 
@@ -2,72 +2,183 @@
 Background async update checker resolving GitHub traces natively.
 Provides caching locking queries to a 24-hr delay preventing API spam.
 """
-import json
+import atexit
+import http.client
+import os
+import re
+import threading
 import time
-import urllib.request
-import urllib.error
+from pathlib import Path
+from urllib.parse import urlsplit
+from typing import Optional
 
 from recon_filter.version import __version__
-from recon_filter.engine.cache import CacheManager
-from rich.console import Console
+from recon_filter.engine.serialization import dumps_bytes, loads
+from recon_filter.io import err_console
 
-console = Console()
+
+VERSION_PROBE_CHUNK_BYTES = 256
+VERSION_PROBE_MAX_BYTES = 4096
+# How long a finishing command waits at exit for an in-flight background check
+BACKGROUND_JOIN_TIMEOUT_S = 1.0
+# Set once the notice has been shown, so a startup check and `update --check` in one process print it once
+_notice_printed = False
+_VERSION_RE = re.compile(r"^__version__\s*=\s*[\"']([^\"']+)[\"']", re.M)
+
+def _user_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "recon-filter"
 
 class UpdateChecker:
     def __init__(self):
-        self.cacher = CacheManager()
-        self.state_file = self.cacher.cache_dir / "update_check.json"
-        
+        self.state_file = _user_cache_dir() / "update_check.json"
+        self.notice_file = _user_cache_dir() / "update_notice.json"
+
         # 24 hours in seconds
         self.check_interval = 86400
         # Replace this URL natively with the actual raw version URL from GitHub upon deployment.
         self.version_url = "https://raw.githubusercontent.com/krvst/recon-filter/main/recon_filter/version.py"
-        
+
     def _read_last_check(self) -> float:
-        if self.state_file.exists():
-            try:
-                with self.state_file.open('r') as f:
-                    data = json.load(f)
-                    return data.get("last_check_time", 0.0)
-            except (json.JSONDecodeError, KeyError):
-                return 0.0
-        return 0.0
-        
-    def _write_last_check(self):
-        with self.state_file.open('w') as f:
-            json.dump({"last_check_time": time.time()}, f)
-            
-    def _parse_version(self, text: str) -> str:
-        for line in text.splitlines():
-            if line.startswith("__version__"):
-                return line.split("=")[1].strip().strip('"\'')
+        # The state file's mtime is the check timestamp, so the cached-out path is one stat() with no parse
+        try:
+            return os.stat(self.state_file).st_mtime
+        except OSError:
+            return 0.0
+
+    def _read_notice(self) -> Optional[str]:
+        # Only present while a newer version is known; the common case is a single failed open
+        try:
+            return loads(self.notice_file.read_bytes()).get("latest_version")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _read_etag(self) -> Optional[str]:
+        try:
+            return loads(self.state_file.read_bytes()).get("etag")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _write_last_check(self, remote_version: Optional[str] = None, etag: Optional[str] = None):
+        # Written via tmp + replace so a background refresh cut short at exit never leaves a torn file
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.state_file.with_suffix(".tmp")
+        state = {"last_check_time": time.time()}
+        if etag:
+            state["etag"] = etag
+        tmp_file.write_bytes(dumps_bytes(state))
+        os.replace(tmp_file, self.state_file)
+
+        if remote_version and remote_version != __version__:
+            tmp_file.write_bytes(dumps_bytes({"latest_version": remote_version}))
+            os.replace(tmp_file, self.notice_file)
+        else:
+            self.notice_file.unlink(missing_ok=True)
+
+    def _parse_version(self, text: str) -> Optional[str]:
+        match = _VERSION_RE.search(text)
+        return match.group(1) if match else None
+
+    def _read_version(self, response) -> Optional[str]:
+        # The version line sits near the top of version.py, so stop reading as soon as it has arrived
+        buf = b""
+        while len(buf) < VERSION_PROBE_MAX_BYTES:
+            chunk = response.read(VERSION_PROBE_CHUNK_BYTES)
+            if not chunk:
+                break
+            buf += chunk
+            remote_version = self._parse_version(buf.decode('utf-8', errors='ignore'))
+            if remote_version:
+                return remote_version
         return None
 
+    def _fetch_remote_version(self) -> Optional[str]:
+        """Fetches the upstream version and records the check. Raises on network failure."""
+        url = urlsplit(self.version_url)
+        headers = {'User-Agent': f'recon-filter/{__version__}', 'Accept-Encoding': 'identity'}
+        etag = self._read_etag()
+        if etag:
+            # GitHub answers 304 with no body when the file is unchanged since the last check
+            headers['If-None-Match'] = etag
+
+        conn = http.client.HTTPSConnection(url.netloc, timeout=3)
+        try:
+            conn.request("GET", url.path, headers=headers)
+            response = conn.getresponse()
+            if response.status == 304:
+                # Unchanged upstream: the recorded notice (if any) is still the latest version
+                remote_version = self._read_notice()
+                self._write_last_check(remote_version, etag)
+                return remote_version
+            if response.status != 200:
+                return None
+            etag = response.getheader("ETag")
+            remote_version = self._read_version(response)
+        finally:
+            conn.close()
+        self._write_last_check(remote_version, etag)
+        return remote_version
+
+    def _claim_check(self):
+        # Bumping the mtime up front means a refresh cut short at exit is not retried by every
+        # following command; the existing ETag, if any, is kept for the next real fetch
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        self.state_file.touch()
+
+    def _print_notice(self, remote_version: str):
+        global _notice_printed
+        if _notice_printed:
+            return
+        _notice_printed = True
+        err_console.print("\n[bold yellow]╭────────────────────────────────────────────────────────────╮[/bold yellow]")
+        err_console.print(f"[bold yellow]│[/bold yellow] A newer version of recon-filter is available: [bold cyan]v{remote_version}[/bold cyan]    [bold yellow]│[/bold yellow]")
+        err_console.print(f"[bold yellow]│[/bold yellow] You are currently using: [bold red]v{__version__}[/bold red]                         [bold yellow]│[/bold yellow]")
+        err_console.print(f"[bold yellow]│[/bold yellow] Please run [bold]recon-filter update[/bold] for instructions.         [bold yellow]│[/bold yellow]")
+        err_console.print("[bold yellow]╰────────────────────────────────────────────────────────────╯[/bold yellow]\n")
+
     def check_for_updates(self, force: bool = False, quiet: bool = False):
-        """Asynchronously checks remote URL. Surpresses all network errors."""
+        """Synchronously checks remote URL. Surpresses all network errors."""
         now = time.time()
         last_check = self._read_last_check()
-        
+
         if not force and (now - last_check) < self.check_interval:
             return # Cached out
-            
+
+        try:
+            remote_version = self._fetch_remote_version()
+            if remote_version and remote_version != __version__:
+                # Basic string compare assumes semantic boundaries mapped properly natively
+                if not quiet:
+                    self._print_notice(remote_version)
+
+        except (OSError, http.client.HTTPException):
+            pass # Fails silently over offline bounds
+
+    def check_in_background(self) -> Optional[threading.Thread]:
+        """
+        Never blocks startup: prints the notice recorded by an earlier run to stderr, then
+        refreshes a stale cache on a daemon thread whose result is shown on the next invocation.
+        The check is claimed before the thread starts, and exit waits briefly for it to finish.
+        """
+        remote_version = self._read_notice()
+        if remote_version and remote_version != __version__:
+            self._print_notice(remote_version)
+
+        if (time.time() - self._read_last_check()) < self.check_interval:
+            return None
+
+        try:
+            self._claim_check()
+        except OSError:
+            return None # Unwritable cache dir: skip rather than refetch on every run
+
+        thread = threading.Thread(target=self._refresh_quietly, name="recon-filter-update-check", daemon=True)
+        thread.start()
+        atexit.register(thread.join, BACKGROUND_JOIN_TIMEOUT_S)
+        return thread
+
+    def _refresh_quietly(self):
         try:
-            req = urllib.request.Request(self.version_url, headers={'User-Agent': f'recon-filter/{__version__}'})
-            with urllib.request.urlopen(req, timeout=3) as response:
-                if response.status == 200:
-                    remote_text = response.read().decode('utf-8')
-                    remote_version = self._parse_version(remote_text)
-                    
-                    self._write_last_check()
-                    
-                    if remote_version and remote_version != __version__:
-                        # Basic string compare assumes semantic boundaries mapped properly natively
-                        if not quiet:
-                            console.print("\n[bold yellow]╭────────────────────────────────────────────────────────────╮[/bold yellow]")
-                            console.print(f"[bold yellow]│[/bold yellow] A newer version of recon-filter is available: [bold cyan]v{remote_version}[/bold cyan]    [bold yellow]│[/bold yellow]")
-                            console.print(f"[bold yellow]│[/bold yellow] You are currently using: [bold red]v{__version__}[/bold red]                         [bold yellow]│[/bold yellow]")
-                            console.print(f"[bold yellow]│[/bold yellow] Please run [bold]recon-filter update[/bold] for instructions.         [bold yellow]│[/bold yellow]")
-                            console.print("[bold yellow]╰────────────────────────────────────────────────────────────╯[/bold yellow]\n")
-
-        except (urllib.error.URLError, Exception):
+            self._fetch_remote_version()
+        except (OSError, http.client.HTTPException):
             pass # Fails silently over offline bounds
@@ -2,8 +2,32 @@
 URL Analytics Engine executing robust parsing natively maintaining streaming limits securely.
 """
 from typing import Optional, Dict, Any, Tuple
-from urllib.parse import urlparse, parse_qs
-import collections
+from urllib.parse import urlparse, unquote
+import re
+import sys
+from functools import lru_cache
+
+_HTTP_PREFIXES = ("http://", "https://")
+# Characters that end an authority section; seeing one right after "//" means an empty netloc
+_EMPTY_AUTHORITY = frozenset(("", "/", "?", "#"))
+# Only a leading scheme counts; a "://" inside the path or query (e.g. ?next=https://...) is not one
+# Tokens urlparse treats specially: brackets (IPv6 hosts, may raise) and ASCII controls/whitespace
+# (tab/CR/LF are stripped, which can leave an empty netloc) must take the slow path
+_URLPARSE_SPECIAL_RE = re.compile(r"[\x00-\x20\x7f\[\]]")
+_SCHEME_PREFIX_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://")
+# Recon URL lists repeat hosts and query shapes heavily; ParseResult is immutable, so parses are shared
+URL_PARSE_CACHE_SIZE = 65536
+
+_urlparse_cached = lru_cache(maxsize=URL_PARSE_CACHE_SIZE)(urlparse)
+
+@lru_cache(maxsize=URL_PARSE_CACHE_SIZE)
+def _url_path(token: str) -> Optional[str]:
+    """Path component of a token, parsed once and shared by the extension and depth extractors."""
+    try:
+        return _urlparse_cached(token if "://" in token else f"http://{token}").path
+    except ValueError:
+        return None
+
 
 class UrlAnalyzer:
     """
@@ -13,7 +37,9 @@ class UrlAnalyzer:
     def __init__(self, config):
         self.config = config
         # We hold lightweight metrics internally, flushing logic securely handled upstream
-        self.param_metrics = collections.defaultdict(int) 
+        self.param_metrics: Dict[str, int] = {}
+        # Only parameter extraction needs the parsed query; plain validation can use the prefix fast path
+        self._needs_parse = bool(config.extract_params or config.param_report)
 
     def analyze_token(self, token: str) -> Tuple[bool, Optional[str]]:
         """
@@ -37,8 +63,20 @@ class UrlAnalyzer:
         if self.config.allow_no_scheme and "://" not in parsing_target:
             parsing_target = f"http://{parsing_target}"
 
+        if not self._needs_parse and parsing_target.startswith(_HTTP_PREFIXES):
+            # Equivalent to urlparse's scheme+netloc test for plain ASCII tokens: the netloc is non-empty
+            # unless the authority ends immediately. Anything urlparse strips, rejects or NFKC-checks
+            # (brackets, controls, whitespace, non-ASCII) takes the slow path instead.
+            host_start = 7 if parsing_target[4] == ':' else 8
+            if (
+                parsing_target[host_start:host_start + 1] not in _EMPTY_AUTHORITY
+                and parsing_target.isascii()
+                and _URLPARSE_SPECIAL_RE.search(parsing_target) is None
+            ):
+                return True, parsing_target
+
         try:
-            parsed = urlparse(parsing_target)
+            parsed = _urlparse_cached(parsing_target)
             
             # A completely valid domain structurally requires a netloc and scheme
             is_valid = bool(parsed.scheme and parsed.netloc)
@@ -60,47 +98,51 @@ class UrlAnalyzer:
 
     def _extract_parameters(self, parsed_url, original_url: str):
         """Builds statistical mapping of observed GET endpoints cleanly natively."""
-        if not parsed_url.query:
+        query = parsed_url.query
+        if not query:
             return
-            
-        params = parse_qs(parsed_url.query)
-        for param_name, values in params.items():
-            # We specifically key by the param_name across all endpoints uniquely as requested
-            key = f"{param_name}"
-            # O(1) Counting hash
-            self.param_metrics[key] += len(values)
+
+        # Same pairs parse_qs would count (non-empty value, '&' separated) without building value lists;
+        # names are only decoded when they actually carry an escape
+        metrics = self.param_metrics
+        for pair in query.split("&"):
+            name, sep, value = pair.partition("=")
+            if not value:
+                continue
+            if "%" in name or "+" in name:
+                name = unquote(name.replace("+", " "))
+            # Interned so the handful of recurring names (id, q, page) resolve by identity on lookup
+            name = sys.intern(name)
+            metrics[name] = metrics.get(name, 0) + 1
 
     def extract_extension(self, token: str) -> str:
         """Determines the active extension (.php, .json) or returns 'none'."""
-        try:
-            target = token if "://" in token else f"http://{token}"
-            parsed = urlparse(target)
-            path = parsed.path
-            
-            if "." in path.split("/")[-1]:
-                ext = path.split("/")[-1].split(".")[-1]
-                if ext.isalnum():
-                    return f".{ext.lower()}"
-        except Exception:
-            pass
+        # Plain string scan mirroring urlparse's path rules: drop query/fragment first, then a leading
+        # scheme and the authority, then ';params' on the last segment
+        rest = token.split("#", 1)[0].split("?", 1)[0]
+        scheme = _SCHEME_PREFIX_RE.match(rest)
+        if scheme:
+            rest = rest[scheme.end():]
+        slash = rest.find("/")
+        if slash < 0:
+            return "none"
+        last = rest[slash:].rsplit("/", 1)[-1].split(";", 1)[0]
+        if "." in last:
+            ext = last.rsplit(".", 1)[-1]
+            if ext.isalnum():
+                return f".{ext.lower()}"
             
         return "none"
         
     def extract_depth(self, token: str) -> int:
         """Counts the URL directory boundaries natively."""
-        try:
-            target = token if "://" in token else f"http://{token}"
-            parsed = urlparse(target)
-            path = parsed.path
-            parts = [p for p in path.split("/") if p]
-            
-            depth = len(parts)
-            if self.config.depth_limit is not None:
-                depth = min(depth, self.config.depth_limit)
-            return depth
-        except Exception:
-            pass
-        return 0
+        path = _url_path(token)
+        if path is None:
+            return 0
+        depth = len([p for p in path.split("/") if p])
+        if self.config.depth_limit is not None:
+            depth = min(depth, self.config.depth_limit)
+        return depth
 
     def generate_report(self) -> Dict[str, Any]:
         """Returns the fully parsed parameter distributions as a dictionary."""
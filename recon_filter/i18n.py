@@ -76,11 +76,16 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
 }
 
 
+# Translations for the current language with the English fallback already applied, so t() is one lookup
+_active: Dict[str, str] = {}
+
+
 def set_language(lang: str):
     """Set the current language globally."""
-    global _current_lang
+    global _current_lang, _active
     if lang in ("en", "id"):
         _current_lang = lang
+        _active = {key: entry.get(lang, entry.get("en", key)) for key, entry in TRANSLATIONS.items()}
 
 
 def get_language() -> str:
@@ -90,5 +95,7 @@ def get_language() -> str:
 
 def t(key: str) -> str:
     """Translate a key to the current language. Falls back to English."""
-    entry = TRANSLATIONS.get(key, {})
-    return entry.get(_current_lang, entry.get("en", key))
+    return _active.get(key, key)
+
+
+set_language(_current_lang)
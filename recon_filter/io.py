@@ -0,0 +1,11 @@
+"""
+Shared Rich consoles used by every command, the logger and the update notice.
+"""
+from rich.console import Console
+
+# One instance means one terminal probe at startup and one output lock for all writers.
+# highlight=False: log lines and tables are already styled explicitly, so the per-print
+# repr-highlighting regex pass is pure overhead.
+console = Console(highlight=False, soft_wrap=True)
+# Advisory output (update notices) goes to stderr so it never mixes into piped results.
+err_console = Console(stderr=True, highlight=False, soft_wrap=True)
@@ -3,11 +3,9 @@ Main Typer application entrypoint with bilingual interactive menu and CLI routin
 """
 import sys
 import typer
-import questionary
-from rich.console import Console
+from recon_filter.io import console
 
 from recon_filter.version import __version__
-from recon_filter.engine.update_check import UpdateChecker
 from recon_filter.i18n import t, set_language
 
 from recon_filter.cli.filter_cmd import filter_cmd
@@ -48,11 +46,11 @@ app.command(name="benchmark")(benchmark_cmd)
 app.command(name="update")(update_cmd)
 app.command(name="self-test")(selftest_cmd)
 
-console = Console()
-
 
 def _select_language():
     """Prompt for language selection."""
+    import questionary
+
     lang = questionary.select(
         "Select Language / Pilih Bahasa:",
         choices=["English", "Bahasa Indonesia"],
@@ -64,38 +62,48 @@ def _select_language():
         set_language("en")
 
 
+def _dispatch(*args: str):
+    """Runs a menu choice through this app's own dispatcher instead of re-executing the CLI in a subprocess."""
+    # standalone_mode=False hands exits back to the menu rather than ending the interpreter,
+    # so usage errors and aborts are reported here the way standalone mode would
+    try:
+        app(["--no-update-check", "--no-menu", *args], prog_name="recon-filter", standalone_mode=False)
+    except typer.Abort:
+        console.print("Aborted!")
+    except Exception as e:
+        # Usage errors (click's, or the copy vendored by newer Typer) render themselves
+        if not callable(getattr(e, "show", None)):
+            raise
+        e.show()
+
+
+_MENU_KEYS = ("menu_filter", "menu_intelligent", "menu_url", "menu_settings", "menu_help", "menu_exit")
+
+
 def run_interactive_menu():
     """Bilingual interactive menu for recon-filter."""
     console.print(f"\n[bold cyan]Recon Filter v{__version__}[/bold cyan]\n")
 
     _select_language()
 
-    choice = questionary.select(
-        t("menu_select"),
-        choices=[
-            t("menu_filter"),
-            t("menu_intelligent"),
-            t("menu_url"),
-            t("menu_settings"),
-            t("menu_help"),
-            t("menu_exit"),
-        ],
-    ).ask()
+    # Resolved once so the offered labels and the comparisons below can never disagree
+    labels = {key: t(key) for key in _MENU_KEYS}
 
-    import os
+    import questionary
+    choice = questionary.select(t("menu_select"), choices=list(labels.values())).ask()
 
-    if choice == t("menu_filter"):
-        os.system("recon-filter filter")
-    elif choice == t("menu_intelligent"):
+    if choice == labels["menu_filter"]:
+        _dispatch("filter")
+    elif choice == labels["menu_intelligent"]:
         console.print(f"[yellow]{t('hint_intelligent')}[/yellow]")
-        os.system("recon-filter filter --intelligent")
-    elif choice == t("menu_url"):
+        _dispatch("filter", "--intelligent")
+    elif choice == labels["menu_url"]:
         console.print(f"[yellow]{t('hint_url')}[/yellow]")
-        os.system("recon-filter filter --extract-params")
-    elif choice == t("menu_settings"):
-        os.system("recon-filter config")
-    elif choice == t("menu_help"):
-        os.system("recon-filter --help")
+        _dispatch("filter", "--extract-params")
+    elif choice == labels["menu_settings"]:
+        _dispatch("config")
+    elif choice == labels["menu_help"]:
+        _dispatch("--help")
     else:
         raise typer.Exit(0)
 
@@ -107,6 +115,10 @@ def global_callback(
     no_menu: bool = typer.Option(False, "--no-menu", help="Bypass interactive menu for direct CLI usage."),
     no_update_check: bool = typer.Option(False, "--no-update-check", help="Disable update checking."),
     force_update_check: bool = typer.Option(False, "--force-update-check", help="Force a remote update check."),
+    background_update_check: bool = typer.Option(
+        False, "--background-update-check", envvar="RECON_FILTER_BACKGROUND_UPDATE_CHECK",
+        help="Opt in to a daily update check on a background thread; results show on the next run.",
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output."),
 ):
     """
@@ -119,9 +131,16 @@ def global_callback(
         console.print(f"recon-filter version: [bold cyan]{__version__}[/bold cyan]")
         raise typer.Exit()
 
+    # Checker and prompt toolkits are imported only on the branches that use them, keeping plain invocations lean
     if force_update_check:
+        from recon_filter.engine.update_check import UpdateChecker
         checker = UpdateChecker()
         checker.check_for_updates(force=True)
+    elif background_update_check and not no_update_check and not ctx.resilient_parsing:
+        # Opt-in only: no network traffic unless asked. The refresh runs on a daemon thread and
+        # any newer version is announced on the next run
+        from recon_filter.engine.update_check import UpdateChecker
+        UpdateChecker().check_in_background()
 
     if ctx.invoked_subcommand is None and not no_menu and not version:
         run_interactive_menu()
@@ -2,22 +2,95 @@
 SHA-256 state tracking for auditing inputs natively.
 """
 import hashlib
+import mmap
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
 
-def calculate_sha256(filepath: Path) -> str:
+# Large reads amortize the per-call read()/update() overhead and let kernel readahead stream the file
+SHA256_BLOCK_SIZE = 1 << 20
+# Past this size the file is hashed straight out of the page cache through mmap, skipping the user-space copy
+MMAP_THRESHOLD_BYTES = 16 << 20
+MMAP_SLICE_BYTES = 4 << 20
+# Bytes read at each of the head/middle/tail offsets in sampled mode
+SAMPLE_CHUNK_BYTES = 1 << 20
+# Files modified more recently than this are never memoized (mtime may not have ticked since the last write)
+MEMO_MIN_AGE_NS = 2 * 10**9
+
+def _update_from_file(hasher, f, size: int) -> None:
+    if size > MMAP_THRESHOLD_BYTES:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            mapped = None # Unmappable handles (special files, exotic filesystems) fall back to reads
+        if mapped is not None:
+            with mapped:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mapped) as view:
+                    for offset in range(0, size, MMAP_SLICE_BYTES):
+                        hasher.update(view[offset:offset + MMAP_SLICE_BYTES])
+            return
+
+    while byte_block := f.read(SHA256_BLOCK_SIZE):
+        hasher.update(byte_block)
+
+def _update_sampled(hasher, f, size: int) -> None:
+    # The size goes in first so truncated or extended files never collide with the original
+    hasher.update(size.to_bytes(8, "little"))
+    for offset in (0, max(0, size // 2 - SAMPLE_CHUNK_BYTES // 2), max(0, size - SAMPLE_CHUNK_BYTES)):
+        f.seek(offset)
+        hasher.update(f.read(SAMPLE_CHUNK_BYTES))
+
+def _digest_file(filepath: Path, hash_algo: str, sample_threshold_bytes: Optional[int]) -> str:
+    # Unbuffered: every path below reads in large blocks or maps the file itself
+    with filepath.open("rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        sampled = sample_threshold_bytes is not None and size > sample_threshold_bytes
+        if hash_algo == "blake3" and HAS_BLAKE3:
+            # Audit/cache digests only; BLAKE3 hashes bulk data several times faster than SHA-256
+            hasher = blake3.blake3()
+        elif not sampled and size <= MMAP_THRESHOLD_BYTES and hasattr(hashlib, "file_digest"):
+            # Python 3.11+: file_digest reads straight into its own buffer in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        else:
+            hasher = hashlib.sha256()
+        if sampled:
+            _update_sampled(hasher, f, size)
+            return f"sampled:{hasher.hexdigest()}"
+        _update_from_file(hasher, f, size)
+        return hasher.hexdigest()
+
+@lru_cache(maxsize=1024)
+def _memoized_digest(resolved: str, mtime_ns: int, size: int, hash_algo: str, sample_threshold_bytes: Optional[int]) -> str:
+    # mtime/size are part of the key so any rewrite of the file misses the cache
+    return _digest_file(Path(resolved), hash_algo, sample_threshold_bytes)
+
+def calculate_sha256(filepath: Path, hash_algo: str = "sha256", sample_threshold_bytes: Optional[int] = None) -> str:
     """
     Calculates SHA-256 for physical files chunk-by-chunk preserving system memory buffers.
+    hash_algo="blake3" uses BLAKE3 instead; FilterConfig only accepts it when the blake3 package is installed.
+    Files larger than sample_threshold_bytes are identified by size plus head, middle and tail
+    chunks only, returned as "sampled:<hex>". That is O(1) in file size but blind to edits
+    elsewhere in the file, so it is opt-in.
+    Unchanged files are hashed once per process (keyed by path, mtime and size).
     Returns empty string if target missing or unreadable.
     """
     if not filepath.exists() or not filepath.is_file():
         return ""
-        
-    sha256_hash = hashlib.sha256()
+
     try:
-        with filepath.open("rb") as f:
-            # Digest 4K blocks 
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        st = filepath.stat()
+        if time.time_ns() - st.st_mtime_ns < MEMO_MIN_AGE_NS:
+            # Coarse filesystem timestamps can leave a just-rewritten file with the same mtime and size
+            return _digest_file(filepath, hash_algo, sample_threshold_bytes)
+        return _memoized_digest(str(filepath.resolve()), st.st_mtime_ns, st.st_size, hash_algo, sample_threshold_bytes)
     except Exception:
         return "integrity_check_failed"
@@ -2,39 +2,89 @@
 Execution bounds ensuring processes don't exceed memory vectors or traverse dangerous paths.
 """
 import os
+import sys
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    HAS_RESOURCE = False
 try:
     import psutil
     HAS_PSUTIL = True
 except ImportError:
     HAS_PSUTIL = False
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 # Maximum permissible RAM extraction (bytes) before halt triggers - Defaults 2GB
 MEMORY_CRITICAL_BYTES = 2 * 1024 * 1024 * 1024 
 
+# ru_maxrss is bytes on macOS, KiB elsewhere
+_MAXRSS_SCALE = 1 if sys.platform == "darwin" else 1024
+# System trees never accepted as filter targets, checked with one startswith() call
+_DENY_PREFIXES = ("/etc/", "/bin/", "/sbin/", "/usr/bin/", "/boot/")
+_process = None
+
+def _current_rss() -> Optional[int]:
+    global _process
+    if HAS_PSUTIL:
+        # Reused across calls; re-created only in a forked worker, where the cached pid is stale
+        if _process is None or _process.pid != os.getpid():
+            _process = psutil.Process()
+        return _process.memory_info().rss
+    return None
+
 def enforce_memory_sandbox():
     """Validates the execution layer hasn't vastly exceeded physical hardware heuristics."""
-    if not HAS_PSUTIL:
+    if HAS_RESOURCE:
+        # One getrusage() syscall: if the peak never crossed the limit, the current RSS cannot have either
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_SCALE
+        if peak <= MEMORY_CRITICAL_BYTES:
+            return
+    current_memory = _current_rss()
+    if current_memory is None:
         return
-    process = psutil.Process(os.getpid())
-    current_memory = process.memory_info().rss
     
     if current_memory > MEMORY_CRITICAL_BYTES:
         raise MemoryError("Process Sandbox Exceeded: The filtering engine exceeded the safe RAM threshold and halted.")
 
+@lru_cache(maxsize=256)
+def _real_dir_cached(directory: str, st_dev: int, st_ino: int, st_mode: int, st_ctime_ns: int) -> str:
+    return os.path.realpath(directory)
+
+def _real_dir(directory: str) -> str:
+    # Batches mostly share a handful of parent directories, so each is realpath'd once per inode;
+    # keying on the lstat identity (mode and ctime guard against inode reuse) makes a directory
+    # swapped for a symlink miss the cache
+    try:
+        st = os.lstat(directory)
+    except OSError:
+        return os.path.realpath(directory)
+    return _real_dir_cached(directory, st.st_dev, st.st_ino, st.st_mode, st.st_ctime_ns)
+
+def _resolve_target(target_path: Path) -> str:
+    raw = os.fspath(target_path)
+    if ".." in Path(raw).parts:
+        # Lexical '..' folding is only equivalent to realpath when no symlink precedes it
+        return os.path.realpath(raw)
+    parent, name = os.path.split(os.path.abspath(raw))
+    resolved = os.path.join(_real_dir(parent), name)
+    # The final component may itself be a link (e.g. ./notes -> /etc/passwd); one lstat decides
+    return os.path.realpath(resolved) if os.path.islink(resolved) else resolved
+
 def validate_path_traversal(target_path: Path, allowed_root: Optional[Path] = None):
     """
     Prevents Arbitrary Path Resolution (e.g. `../../../etc/passwd`).
     If allowed_root provided, strictly mandates paths live within it.
     """
-    absolute_target = target_path.resolve()
+    absolute_target = _resolve_target(target_path)
     
     # Block systemic overrides if detected
-    if str(absolute_target).startswith("/etc/") or str(absolute_target).startswith("/bin/"):
+    if absolute_target.startswith(_DENY_PREFIXES):
         raise PermissionError(f"Security Sandbox Denied: Unrestricted system directory targeted: {absolute_target}")
         
     if allowed_root:
-        absolute_root = allowed_root.resolve()
-        if not str(absolute_target).startswith(str(absolute_root)):
+        absolute_root = _real_dir(os.path.abspath(allowed_root))
+        if os.path.commonpath([absolute_target, absolute_root]) != absolute_root:
             raise PermissionError(f"Security Sandbox Denied: Path traversed outside trusted execution boundaries.")
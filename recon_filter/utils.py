@@ -3,41 +3,46 @@ Utility helper functions for recon-filter v3.
 Ensures strict, professional tone mapping devoid of emojis or casual logs.
 """
 import logging
-from rich.console import Console
-
-# Rich setup for terminal aesthetics (Strict, lean formats)
-console = Console()
-
-BANNER = r"""
-  ██▀███   ▓█████  ▄████▄   ▒█████   ███▄    █  ▄▄▄██▀▀▀ ██▓ ██▓    ▄▄▄█████▓▓█████  ██▀███      
-  ▓██ ▒ ██▒▓█   ▀ ▒██▀ ▀█  ▒██▒  ██▒ ██ ▀█   █    ▒██    ▓██▒▓██▒    ▓  ██▒ ▓▒▓█   ▀ ▓██ ▒ ██▒   
-  ▓██ ░▄█ ▒▒███   ▒▓█    ▄ ▒██░  ██▒▓██  ▀█ ██▒   ░██    ▒██▒▒██░    ▒ ▓██░ ▒░▒███   ▓██ ░▄█ ▒   
-  ▒██▀▀█▄  ▒▓█  ▄ ▒▓▓▄ ▄██▒▒██   ██░▓██▒  ▐▌██▒ ▓██▄██▓  ░██░▒██░    ░ ▓██▓ ░ ▒▓█  ▄ ▒██▀▀█▄     
-  ░██▓ ▒██▒░▒████▒▒ ▓███▀ ░░ ████▓▒░▒██░   ▓██░  ▓███▒   ░██░░██████▒  ▒██▒ ░ ░▒████▒░██▓ ▒██▒   
-  ░ ▒▓ ░▒▓░░░ ▒░ ░░ ░▒ ▒  ░░ ▒░▒░▒░ ░ ▒░   ▒ ▒   ▒▓▒▒░   ░▓  ░ ▒░▓  ░  ▒ ░░   ░░ ▒░ ░░ ▒▓ ░▒▓░   
-    ░▒ ░ ▒░ ░ ░  ░  ░  ▒     ░ ▒ ▒░ ░ ░░   ░ ▒░   ▒ ░▒░    ▒ ░░ ░ ▒  ░    ░     ░ ░  ░  ░▒ ░ ▒░  
-    ░░   ░    ░   ░        ░ ░ ░ ▒     ░   ░ ░    ░ ░ ░    ▒ ░  ░ ░     ░       ░     ░░   ░     
-     ░        ░  ░░ ░          ░ ░           ░    ░   ░    ░      ░  ░          ░  ░   ░         
-             ░                                                                                   
-             Professional Stream Processing Engine for System Logs & Recon Data                  
-"""
+from recon_filter.io import console
+
+
+_ERROR_PREFIX = "[bold red]ERROR:[/bold red]"
+_WARNING_PREFIX = "[bold yellow]WARNING:[/bold yellow]"
+_INFO_PREFIX = "[cyan]INFO:[/cyan]"
+
+# Standard levels resolve with one dict hit; custom levels fall back to the threshold comparison
+_LEVEL_PREFIX = {
+    logging.CRITICAL: _ERROR_PREFIX,
+    logging.ERROR: _ERROR_PREFIX,
+    logging.WARNING: _WARNING_PREFIX,
+    logging.INFO: _INFO_PREFIX,
+    logging.DEBUG: _INFO_PREFIX,
+}
+
+
+def _level_prefix(levelno: int) -> str:
+    if levelno >= logging.ERROR:
+        return _ERROR_PREFIX
+    if levelno >= logging.WARNING:
+        return _WARNING_PREFIX
+    return _INFO_PREFIX
+
 
 class RichHandler(logging.Handler):
     """Custom logging handler mapping logic via Rich explicitly avoiding tracebacks by default."""
     def emit(self, record):
-        msg = self.format(record)
-        if record.levelno >= logging.ERROR:
-            console.print(f"[bold red]ERROR:[/bold red] {msg}")
-        elif record.levelno >= logging.WARNING:
-            console.print(f"[bold yellow]WARNING:[/bold yellow] {msg}")
-        else:
-            console.print(f"[cyan]INFO:[/cyan] {msg}")
+        prefix = _LEVEL_PREFIX.get(record.levelno) or _level_prefix(record.levelno)
+        console.print(prefix, self.format(record))
+
+
+_banner_printed = False
 
 
 def setup_logger(verbose: bool = False, quiet: bool = False) -> logging.Logger:
     """
     Configures the root logger for the application cleanly.
     """
+    global _banner_printed
     logger = logging.getLogger("recon_filter")
     
     if logger.hasHandlers():
@@ -49,8 +54,10 @@ def setup_logger(verbose: bool = False, quiet: bool = False) -> logging.Logger:
         logger.addHandler(logging.NullHandler())
     else:
         # We explicitly print the banner here once natively.
-        if not verbose and len(logging.getLogger().handlers) == 0:
-             console.print(f"[bold blue]{BANNER}[/bold blue]")
+        if not verbose and not _banner_printed and len(logging.getLogger().handlers) == 0:
+             from recon_filter.banner import BANNER_TEXT
+             console.print(BANNER_TEXT)
+             _banner_printed = True
              
         handler = RichHandler()
         formatter = logging.Formatter("%(message)s")
@@ -0,0 +1,12 @@
+"""
+Shared pytest fixtures for the recon-filter suite.
+"""
+import pytest
+
+from recon_filter.engine.filtering import RuleCompiler
+
+
+@pytest.fixture(scope="session")
+def error_regex():
+    """Case-insensitive '^ERROR', compiled once for every test that only reads it."""
+    return RuleCompiler.compile_regex("^ERROR", False, False)
@@ -0,0 +1,90 @@
+"""
+End-to-end tests driving the Typer CLI in-process.
+"""
+import concurrent.futures
+import json
+
+from typer.testing import CliRunner
+
+from recon_filter.main import app
+
+runner = CliRunner()
+
+
+def test_filter_runs_multiple_files_on_process_pool(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pools = []
+
+    class RecordingPool(concurrent.futures.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append((kwargs.get("max_workers"), kwargs.get("mp_context")))
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", RecordingPool)
+
+    inputs = []
+    for name, lines in (("a.log", ["ERROR one", "ok", "ERROR two"]), ("b.log", ["fine", "ERROR three"])):
+        path = tmp_path / name
+        path.write_text("\n".join(lines) + "\n")
+        inputs.append(str(path))
+    out_dir = tmp_path / "out"
+    stats_path = tmp_path / "stats.json"
+
+    result = runner.invoke(app, [
+        "--no-update-check", "filter", *inputs,
+        "--regex", "^ERROR", "--max-workers", "2", "--no-backup", "--no-footer",
+        "--output-dir", str(out_dir), "--export-stats", str(stats_path),
+    ])
+
+    assert result.exit_code == 0, result.output
+    assert [workers for workers, _ in pools] == [2]
+    assert (out_dir / "a_filtered.log").read_text() == "ERROR one\nERROR two\n"
+    assert (out_dir / "b_filtered.log").read_text() == "ERROR three\n"
+    payload = json.loads(stats_path.read_text())
+    assert payload["aggregate_files"] == 2
+    assert payload["aggregate_matches"] == 3
+
+
+def test_filter_avoids_fork_while_other_threads_run(tmp_path, monkeypatch):
+    import threading
+    monkeypatch.chdir(tmp_path)
+    contexts = []
+
+    class RecordingPool(concurrent.futures.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            contexts.append(kwargs.get("mp_context"))
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", RecordingPool)
+    for name in ("a.log", "b.log"):
+        (tmp_path / name).write_text("ERROR hit\n")
+
+    # Stands in for a background update check still in flight
+    release = threading.Event()
+    worker = threading.Thread(target=release.wait, daemon=True)
+    worker.start()
+    try:
+        result = runner.invoke(app, [
+            "filter", str(tmp_path / "a.log"), str(tmp_path / "b.log"),
+            "--regex", "^ERROR", "--max-workers", "2", "--no-backup", "--output-dir", str(tmp_path / "out"),
+        ])
+    finally:
+        release.set()
+        worker.join()
+
+    assert result.exit_code == 0, result.output
+    assert [ctx.get_start_method() for ctx in contexts] == ["forkserver"]
+    assert (tmp_path / "out" / "b_filtered.log").exists()
+
+
+def test_update_check_is_opt_in(monkeypatch):
+    from recon_filter.engine.update_check import UpdateChecker
+    calls = []
+    monkeypatch.setattr(UpdateChecker, "check_in_background", lambda self: calls.append("background"))
+    monkeypatch.setattr(UpdateChecker, "check_for_updates", lambda self, **kw: calls.append("sync"))
+    monkeypatch.delenv("RECON_FILTER_BACKGROUND_UPDATE_CHECK", raising=False)
+
+    assert runner.invoke(app, ["--no-menu"]).exit_code == 0
+    assert calls == []
+    assert runner.invoke(app, ["--background-update-check", "--no-menu"]).exit_code == 0
+    assert calls == ["background"]
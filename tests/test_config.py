@@ -39,3 +39,22 @@ def test_config_invalid_extension(tmp_path):
     bad_path = tmp_path / "test.txt"
     with pytest.raises(ValueError):
         ConfigManager.save(FilterConfig(), bad_path)
+
+def test_config_hash_algo_validation(monkeypatch):
+    from recon_filter.security import integrity
+    monkeypatch.setattr(integrity, "HAS_BLAKE3", True)
+    assert FilterConfig(hash_algo="BLAKE3").hash_algo == "blake3"
+    with pytest.raises(ValueError):
+        FilterConfig(hash_algo="md5")
+
+def test_config_rejects_blake3_without_package(monkeypatch):
+    from recon_filter.security import integrity
+    monkeypatch.setattr(integrity, "HAS_BLAKE3", False)
+    with pytest.raises(ValueError, match="blake3"):
+        FilterConfig(hash_algo="blake3")
+
+def test_config_hash_sample_threshold_validation():
+    assert FilterConfig(hash_sample_threshold_mb=1).hash_sample_threshold_mb == 1
+    for bad in (0, -5):
+        with pytest.raises(ValueError):
+            FilterConfig(hash_sample_threshold_mb=bad)
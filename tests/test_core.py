@@ -12,10 +12,41 @@ def compile_regex(pattern, case_sensitive):
     return RuleCompiler.compile_regex(pattern, case_sensitive, False)
 
 
-def test_compile_regex_valid():
-    compiled = compile_regex("^ERROR", False)
+def test_compile_regex_valid(error_regex):
+    compiled = error_regex
     assert isinstance(compiled, re.Pattern)
 
+def test_compile_regex_falls_back_from_re2(monkeypatch):
+    import recon_filter.engine.filtering as filtering
+    class RejectingRe2:
+        @staticmethod
+        def compile(pattern):
+            raise ValueError("unsupported")
+    monkeypatch.setattr(filtering, "HAS_RE2", True)
+    monkeypatch.setattr(filtering, "re2", RejectingRe2, raising=False)
+    compiled = RuleCompiler.compile_regex(r"(a)\1", False, False, True)
+    assert isinstance(compiled, re.Pattern)
+    assert compiled.search("xAAx")
+
+def test_re2_is_opt_in_for_user_regex(monkeypatch):
+    import recon_filter.engine.filtering as filtering
+    class FakeRe2:
+        compiled = []
+        @staticmethod
+        def compile(pattern):
+            FakeRe2.compiled.append(pattern)
+            return re.compile(pattern)
+    monkeypatch.setattr(filtering, "HAS_RE2", True)
+    monkeypatch.setattr(filtering, "re2", FakeRe2, raising=False)
+
+    compile_regex("opt-in-default", True)
+    assert FakeRe2.compiled == []
+    RuleCompiler.compile_regex("opt-in-enabled", True, False, True)
+    assert FakeRe2.compiled == ["opt-in-enabled"]
+    # Keyword alternations are plain literals, so they use RE2 without the flag
+    filtering._compile_alternation(("optinkw",), True)
+    assert FakeRe2.compiled == ["opt-in-enabled", "optinkw"]
+
 def test_compile_regex_invalid():
     with pytest.raises(ValueError):
         compile_regex("[invalid(regex", False)
@@ -93,7 +124,7 @@ def test_apply_filters_length_constraints():
     is_match, _ = apply_filters("perfect length", config, None)
     assert is_match is True
 
-def test_apply_filters_combined_and():
+def test_apply_filters_combined_and(error_regex):
     # Both Regex and Keywords MUST match
     config = FilterConfig(
         regex_pattern="^ERROR",
@@ -101,7 +132,7 @@ def test_apply_filters_combined_and():
         match_logic="and",
         case_sensitive=False
     )
-    compiled = compile_regex(config.regex_pattern, config.case_sensitive)
+    compiled = error_regex
     
     # Matches both
     is_match, _ = apply_filters("ERROR: database connection lost", config, compiled)
@@ -114,3 +145,87 @@ def test_apply_filters_combined_and():
     # Matches keyword, but misses regex anchor
     is_match, _ = apply_filters("WARN: database lagging", config, compiled)
     assert is_match is False
+
+def test_apply_filters_exclude_keywords_case_insensitive():
+    config = FilterConfig(
+        keywords=["apple"],
+        exclude_keywords=["Rotten"],
+        case_sensitive=False
+    )
+    keyword_set = RuleCompiler.compile_keyword_set(config.keywords, config.exclude_keywords, config.case_sensitive)
+    
+    is_match, _ = apply_filters("a fresh APPLE", config, None, keyword_set=keyword_set)
+    assert is_match is True
+    
+    is_match, _ = apply_filters("a ROTTEN apple", config, None, keyword_set=keyword_set)
+    assert is_match is False
+
+def test_apply_filters_keyword_scores_mixed_case():
+    config = FilterConfig(
+        keywords=["Admin", "TOKEN"],
+        match_logic="or",
+        keyword_scores={"Admin": 5, "TOKEN": 3},
+        case_sensitive=False
+    )
+    keyword_set = RuleCompiler.compile_keyword_set(config.keywords, config.exclude_keywords, config.case_sensitive)
+    
+    is_match, score = apply_filters("https://x.com/admin?token=1", config, None, keyword_set=keyword_set)
+    assert is_match is True
+    assert score == 8
+
+def test_apply_filters_automaton_hits_match_substring_checks():
+    config = FilterConfig(
+        keywords=["api", "apikey", "key", "KEY"],
+        match_logic="and",
+        keyword_scores={"api": 1, "apikey": 2, "key": 4},
+        case_sensitive=False
+    )
+    keyword_set = RuleCompiler.compile_keyword_set(config.keywords, config.exclude_keywords, config.case_sensitive)
+    plain_set = keyword_set._replace(automaton=None)
+    
+    for logic in ("and", "or"):
+        config.match_logic = logic
+        for line in ["GET /v1/APIKEY", "GET /v1/api", "monkey", "nothing"]:
+            assert apply_filters(line, config, None, keyword_set=keyword_set) == apply_filters(line, config, None, keyword_set=plain_set)
+
+def test_apply_filters_min_score_early_exit():
+    config = FilterConfig(
+        keywords=["admin", "token", "debug"],
+        keyword_scores={"admin": 5, "token": 5, "debug": 5},
+        min_score=5,
+        case_sensitive=False
+    )
+    keyword_set = RuleCompiler.compile_keyword_set(config.keywords, config.exclude_keywords, config.case_sensitive, config.keyword_scores)
+    line = "/admin?token=1&debug=1"
+    
+    assert apply_filters(line, config, None, keyword_set=keyword_set) == (True, 15)
+    assert apply_filters(line, config, None, keyword_set=keyword_set, full_score=False) == (True, 5)
+    
+    # A negative score later in the list can still sink the match, so no early exit
+    config.keyword_scores["debug"] = -10
+    keyword_set = RuleCompiler.compile_keyword_set(config.keywords, config.exclude_keywords, config.case_sensitive, config.keyword_scores)
+    assert apply_filters(line, config, None, keyword_set=keyword_set, full_score=False) == (False, 0)
+
+@pytest.mark.parametrize("logic,line,expected", [
+    ("and", "ERROR admin", True),
+    ("and", "ERROR guest", False),
+    ("or", "ERROR guest", True),
+    ("or", "INFO guest", False),
+])
+def test_apply_filters_regex_keyword_combination(logic, line, expected, error_regex):
+    config = FilterConfig(regex_pattern="^ERROR", keywords=["admin"], match_logic=logic)
+    
+    is_match, _ = apply_filters(line, config, error_regex)
+    assert is_match is expected
+
+def test_match_mode_follows_compiled_regex(error_regex):
+    # The combination plan comes from the regex actually passed, not from how the keyword set was built
+    config = FilterConfig(regex_pattern="^ERROR", keywords=["admin"])
+    keyword_set = RuleCompiler.compile_keyword_set(config.keywords, config.exclude_keywords, config.case_sensitive)
+    assert apply_filters("ERROR: disk full", config, error_regex, keyword_set=keyword_set)[0] is True
+    assert apply_filters("ERROR: disk full", config, None, keyword_set=keyword_set)[0] is False
+    assert apply_filters("GET /admin", config, None, keyword_set=keyword_set)[0] is True
+
+def test_compile_regex_is_memoized():
+    assert compile_regex("memo(ized)?", True) is compile_regex("memo(ized)?", True)
+    assert compile_regex("memo(ized)?", True) is not compile_regex("memo(ized)?", False)
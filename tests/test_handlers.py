@@ -5,6 +5,7 @@ import csv
 from pathlib import Path
 from recon_filter.config import FilterConfig
 from recon_filter.engine.core import EngineProcessor
+from recon_filter.engine.handlers.json_handler import JsonFileReader
 from recon_filter.security.integrity import calculate_sha256
 
 def test_json_preservation(tmp_path):
@@ -94,3 +95,258 @@ def test_preview_mode(tmp_path):
     # Assert physical write did NOT happen
     out_file = tmp_path / "test_filtered.txt"
     assert not out_file.exists()
+
+def test_csv_quoted_commas_preserved(tmp_path):
+    csv_path = tmp_path / "quoted.csv"
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "msg"])
+        writer.writerow(["1", "FATAL crash, disk full"])
+        writer.writerow(["2", "debug trace"])
+        
+    config = FilterConfig(
+        regex_pattern="FATAL"
+    )
+    
+    processor = EngineProcessor(csv_path, tmp_path, config)
+    processor.process()
+    
+    out_file = tmp_path / "quoted_filtered.csv"
+    
+    with open(out_file, 'r', newline='') as f:
+        reader = list(csv.reader(f))
+        assert reader == [["id", "msg"], ["1", "FATAL crash, disk full"]]
+
+def test_csv_matches_on_parsed_fields(tmp_path):
+    csv_path = tmp_path / "events.csv"
+    csv_path.write_text('msg,code\n"ERROR, disk full",1\nok,2\n')
+
+    config = FilterConfig(regex_pattern="^ERROR")
+    stats = EngineProcessor(csv_path, tmp_path, config).process()
+
+    assert stats["matches_found"] == 1
+    with open(tmp_path / "events_filtered.csv", 'r', newline='') as f:
+        assert list(csv.reader(f)) == [["msg", "code"], ["ERROR, disk full", "1"]]
+
+def test_csv_keeps_url_normalization(tmp_path):
+    csv_path = tmp_path / "hosts.csv"
+    csv_path.write_text('url,code\nx.com/a,1\n"x.com/b, c",2\n"https://y.com/z",3\n')
+
+    config = FilterConfig(keywords=["com"], allow_no_scheme=True, no_footer=True)
+    EngineProcessor(csv_path, tmp_path, config).process()
+
+    out_text = (tmp_path / "hosts_filtered.csv").read_text()
+    with open(tmp_path / "hosts_filtered.csv", newline='') as f:
+        assert list(csv.reader(f)) == [
+            ["url", "code"], ["http://x.com/a", "1"], ["http://x.com/b, c", "2"], ["https://y.com/z", "3"],
+        ]
+    # Rows the normalization left alone are still forwarded verbatim
+    assert '"https://y.com/z",3' in out_text
+
+def test_cluster_writer_pool_eviction(tmp_path, monkeypatch):
+    import recon_filter.engine.core as core
+    monkeypatch.setattr(core, "MAX_OPEN_CLUSTER_WRITERS", 2)
+    
+    txt_path = tmp_path / "urls.txt"
+    urls = [
+        "https://a.com/x", "https://a.com/x/y", "https://a.com/x/y/z",
+        "https://a.com/p", "https://a.com/p/q/r",
+    ]
+    with open(txt_path, 'w') as f:
+        f.write("\n".join(urls) + "\n")
+        
+    config = FilterConfig(
+        keywords=["a.com"],
+        group_by_depth=True,
+        no_footer=True
+    )
+    
+    processor = EngineProcessor(txt_path, tmp_path, config)
+    stats = processor.process()
+    
+    assert stats["matches_found"] == 5
+    assert (tmp_path / "urls_depth_1.txt").read_text().splitlines() == ["https://a.com/x", "https://a.com/p"]
+    assert (tmp_path / "urls_depth_3.txt").read_text().splitlines() == ["https://a.com/x/y/z", "https://a.com/p/q/r"]
+    assert not list(tmp_path.glob("*.tmp"))
+
+def test_cluster_writers_share_buffer_budget(tmp_path, monkeypatch):
+    import recon_filter.engine.core as core
+    from recon_filter.engine.handlers.text_handler import TextOutputWriter
+    opened = []
+    original_open = TextOutputWriter._open_atomic
+    def recording_open(self, mode):
+        opened.append((self.buffer_bytes, self.batch_items))
+        original_open(self, mode)
+    monkeypatch.setattr(TextOutputWriter, "_open_atomic", recording_open)
+
+    txt_path = tmp_path / "urls.txt"
+    txt_path.write_text("https://a.com/x\nhttps://a.com/x/y\n")
+    EngineProcessor(txt_path, tmp_path, FilterConfig(keywords=["a.com"], group_by_depth=True, no_footer=True)).process()
+
+    per_writer = core.CLUSTER_WRITE_BUDGET_BYTES // core.MAX_OPEN_CLUSTER_WRITERS
+    assert opened == [(per_writer, core.CLUSTER_WRITE_BATCH_ITEMS)] * 2
+    assert per_writer * core.MAX_OPEN_CLUSTER_WRITERS <= core.CLUSTER_WRITE_BUDGET_BYTES
+
+def test_encoding_detection_cached_by_sample(monkeypatch):
+    from recon_filter.engine.handlers import text_handler
+    
+    calls = []
+    real_detect = text_handler._chardet.detect
+    monkeypatch.setattr(text_handler._chardet, "detect", lambda raw: calls.append(raw) or real_detect(raw))
+    
+    sample = "encoding sample éè line\n".encode("utf-8") * 10
+    first = text_handler.detect_sample_encoding(sample)
+    second = text_handler.detect_sample_encoding(sample)
+    
+    assert first == second
+    assert len(calls) == 1
+
+def test_text_writer_flushes_batched_lines(tmp_path):
+    from recon_filter.engine.interfaces import WRITE_BATCH_ITEMS
+    
+    txt_path = tmp_path / "bulk.txt"
+    total = WRITE_BATCH_ITEMS * 2 + 7
+    txt_path.write_text("".join(f"hit {i}\n" for i in range(total)))
+    
+    config = FilterConfig(keywords=["hit"], no_footer=True, no_backup=True)
+    stats = EngineProcessor(txt_path, tmp_path, config).process()
+    
+    lines = (tmp_path / "bulk_filtered.txt").read_text().splitlines()
+    assert stats["matches_found"] == total
+    assert lines == [f"hit {i}" for i in range(total)]
+
+def test_json_float_values_roundtrip(tmp_path):
+    json_path = tmp_path / "floats.json"
+    data = [{"id": 1, "ratio": 0.5, "msg": "CRITICAL"}, {"id": 2, "ratio": 1.25, "msg": "INFO"}]
+    json_path.write_text(json.dumps(data))
+    
+    config = FilterConfig(regex_pattern="CRITICAL", no_backup=True)
+    EngineProcessor(json_path, tmp_path, config).process()
+    
+    with open(tmp_path / "floats_filtered.json") as f:
+        assert json.load(f) == [data[0]]
+
+def test_json_root_map_with_leading_whitespace(tmp_path):
+    json_path = tmp_path / "root.json"
+    json_path.write_text('\n   {"alpha": "CRITICAL", "beta": "INFO"}')
+    
+    reader = JsonFileReader(json_path, FilterConfig())
+    assert [json.loads(x) for x in reader.read()] == [{"alpha": "CRITICAL"}, {"beta": "INFO"}]
+
+def test_text_reader_splits_across_chunk_boundaries(tmp_path, monkeypatch):
+    from recon_filter.engine.handlers import text_handler
+    monkeypatch.setattr(text_handler, "READ_CHUNK_CHARS", 7)
+    
+    txt_path = tmp_path / "chunks.log"
+    txt_path.write_bytes(b"first line\r\nsecond\n\nthird line without newline")
+    
+    reader = text_handler.TextFileReader(txt_path, FilterConfig(encoding="utf-8"))
+    assert list(reader.read()) == ["first line", "second", "", "third line without newline"]
+
+def test_json_trusted_writer_guards_rewritten_items(tmp_path):
+    from recon_filter.engine.handlers.json_handler import JsonOutputWriter
+    out_path = tmp_path / "trusted.json"
+    
+    with JsonOutputWriter(out_path, FilterConfig(), trusted_json=True) as writer:
+        writer.write('{"id":1}')
+        writer.write('http://{"id":2}')
+        writer.success = True
+    
+    with open(out_path) as f:
+        assert json.load(f) == [{"id": 1}, 'http://{"id":2}']
+
+def test_json_trusted_writer_skips_parse_for_string_items(tmp_path, monkeypatch):
+    from recon_filter.engine.handlers import json_handler
+    def fail_loads(item):
+        raise AssertionError(f"re-parsed {item!r}")
+    monkeypatch.setattr(json_handler, "loads", fail_loads)
+    out_path = tmp_path / "urls.json"
+
+    with json_handler.JsonOutputWriter(out_path, FilterConfig(), trusted_json=True) as writer:
+        writer.write('"https://x.com/admin"')
+        writer.write('{"url":"https://x.com/api"}')
+        writer.success = True
+
+    with open(out_path) as f:
+        assert json.load(f) == ["https://x.com/admin", {"url": "https://x.com/api"}]
+
+def test_pdf_text_splits_non_blank_lines():
+    from recon_filter.engine.handlers.pdf_handler import _non_blank_lines
+    assert list(_non_blank_lines("admin panel\n\n   \n  /api/v1\r\ntoken \n\t")) == ["admin panel", "  /api/v1", "token "]
+
+def test_pdf_missing_backends_name_both_packages(tmp_path, monkeypatch):
+    from recon_filter.engine.handlers import pdf_handler
+    monkeypatch.setattr(pdf_handler, "HAS_PDFIUM", False)
+    monkeypatch.setattr(pdf_handler, "HAS_PYPDF", False)
+    with pytest.raises(RuntimeError, match="pypdfium2' or 'pypdf"):
+        pdf_handler.PdfFileReader(tmp_path / "in.pdf", FilterConfig())
+    with pytest.raises(RuntimeError, match="'pypdf' package"):
+        pdf_handler.PdfOutputWriter(tmp_path / "out.pdf", FilterConfig())
+
+def test_pdf_text_long_blank_run_is_linear():
+    import time
+    from recon_filter.engine.handlers.pdf_handler import _non_blank_lines
+    start = time.perf_counter()
+    assert list(_non_blank_lines("head\n" + " " * 200000 + "\ntail")) == ["head", "tail"]
+    assert time.perf_counter() - start < 1.0
+
+@pytest.mark.parametrize("disable", [(), ("copy_file_range",), ("copy_file_range", "sendfile")])
+def test_append_mode_concatenates_output(tmp_path, monkeypatch, disable):
+    from recon_filter.engine import interfaces
+    for name in disable:
+        monkeypatch.delattr(interfaces.os, name, raising=False)
+    
+    txt_path = tmp_path / "append.log"
+    txt_path.write_text("CRITICAL two\nINFO skip\n")
+    out_file = tmp_path / "append_filtered.log"
+    out_file.write_text("CRITICAL one\n")
+    
+    config = FilterConfig(keywords=["CRITICAL"], append_mode=True, no_backup=True, no_footer=True, enable_cache=False)
+    EngineProcessor(txt_path, tmp_path, config).process()
+    
+    assert out_file.read_text() == "CRITICAL one\nCRITICAL two\n"
+    assert not Path(f"{out_file}.tmp").exists()
+
+def test_backup_copies_content_and_mtime(tmp_path, monkeypatch):
+    import os
+    import recon_filter.security.backup as backup
+    src = tmp_path / "input.log"
+    src.write_bytes(b"line\n" * 5000)
+    os.utime(src, ns=(10**18, 10**18))
+    for in_kernel in (True, False):
+        if not in_kernel:
+            monkeypatch.setattr(backup, "_clone_in_kernel", lambda *a: False)
+        bak = backup.execute_backup(src, custom_dir=str(tmp_path / f"bak_{in_kernel}"))
+        assert bak.read_bytes() == src.read_bytes()
+        assert bak.stat().st_mtime_ns == 10**18
+
+def test_hash_report_overlaps_backup_without_cache(tmp_path):
+    txt_path = tmp_path / "test.txt"
+    txt_path.write_text("line 1\nline 2\n")
+    config = FilterConfig(keywords=["line"], enable_cache=False, generate_hash_report=True)
+    stats = EngineProcessor(txt_path, tmp_path, config).process()
+    assert (tmp_path / "test.txt.bak").exists()
+    assert stats["hash_pre"] == calculate_sha256(txt_path)
+
+def test_backup_without_metadata_is_content_only(tmp_path):
+    import os
+    from recon_filter.security.backup import execute_backup
+    src = tmp_path / "input.log"
+    src.write_bytes(b"payload\n")
+    os.utime(src, ns=(10**18, 10**18))
+    bak = execute_backup(src, custom_dir=str(tmp_path / "bak"), preserve_metadata=False)
+    assert bak.read_bytes() == b"payload\n"
+    assert bak.stat().st_mtime_ns != 10**18
+
+def test_backup_content_only_config_reaches_backup(tmp_path):
+    import os
+    src = tmp_path / "input.log"
+    src.write_text("CRITICAL one\n")
+    os.chmod(src, 0o600)
+    os.utime(src, ns=(10**18, 10**18))
+    config = FilterConfig(regex_pattern="CRITICAL", backup_content_only=True, enable_cache=False)
+    EngineProcessor(src, tmp_path, config).process()
+    bak = tmp_path / "input.log.bak"
+    assert bak.read_text() == "CRITICAL one\n"
+    assert bak.stat().st_mtime_ns != 10**18
+    assert bak.stat().st_mode & 0o777 == 0o600
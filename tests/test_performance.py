@@ -1,4 +1,5 @@
 import pytest
+import os
 import tempfile
 import json
 from pathlib import Path
@@ -57,3 +58,121 @@ def test_ijson_streaming_preservation(tmp_path):
         rendered = json.load(f)
         assert len(rendered) == 5
         assert all("CRITICAL" in r["val"] for r in rendered)
+
+def test_preview_skips_pre_hash(tmp_path):
+    test_file = tmp_path / "preview_hash.txt"
+    with test_file.open('w') as f:
+        f.write("error map 1\nerror map 2\n")
+        
+    config = FilterConfig(
+        regex_pattern="error",
+        preview=True
+    )
+    
+    processor = EngineProcessor(test_file, tmp_path, config)
+    stats = processor.process()
+    
+    assert stats["matches_found"] == 2
+    assert stats["hash_pre"] == "disabled"
+    assert stats["skipped_cache"] is False
+
+def test_monitor_sampler_thread_lifecycle():
+    from recon_filter.engine.performance import PerformanceMonitor, HAS_PSUTIL
+    if not HAS_PSUTIL:
+        pytest.skip("psutil not installed")
+    monitor = PerformanceMonitor()
+    monitor.start()
+    assert monitor._sampler.is_alive()
+    sampler = monitor._sampler
+    monitor.stop()
+    
+    assert not sampler.is_alive()
+    report = monitor.generate_report()
+    assert report["peak_memory_mb"] > 0
+    assert monitor.cpu_samples
+
+def test_sha256_mmap_path_matches_hashlib(tmp_path, monkeypatch):
+    import hashlib
+    import recon_filter.security.integrity as integrity
+    monkeypatch.setattr(integrity, "MMAP_THRESHOLD_BYTES", 1024)
+    monkeypatch.setattr(integrity, "MMAP_SLICE_BYTES", 4096)
+    payload = bytes(range(256)) * 100
+    target = tmp_path / "big.bin"
+    target.write_bytes(payload)
+    assert calculate_sha256(target) == hashlib.sha256(payload).hexdigest()
+
+def test_sampled_hash_only_above_threshold(tmp_path, monkeypatch):
+    import recon_filter.security.integrity as integrity
+    monkeypatch.setattr(integrity, "SAMPLE_CHUNK_BYTES", 16)
+    target = tmp_path / "big.bin"
+    target.write_bytes(b"a" * 1000)
+    full = calculate_sha256(target, sample_threshold_bytes=1000)
+    sampled = calculate_sha256(target, sample_threshold_bytes=999)
+    assert not full.startswith("sampled:")
+    assert sampled.startswith("sampled:")
+    # An edit inside a sampled window changes the digest; the size is mixed in too
+    target.write_bytes(b"a" * 999 + b"b")
+    assert calculate_sha256(target, sample_threshold_bytes=999) != sampled
+    target.write_bytes(b"a" * 1001)
+    assert calculate_sha256(target, sample_threshold_bytes=999) != sampled
+
+def test_sha256_memoized_until_file_changes(tmp_path, monkeypatch):
+    import os
+    import recon_filter.security.integrity as integrity
+    target = tmp_path / "settled.txt"
+    target.write_text("one\n")
+    os.utime(target, ns=(10**18, 10**18))
+    calls = []
+    real = integrity._digest_file
+    monkeypatch.setattr(integrity, "_digest_file", lambda *a: calls.append(a) or real(*a))
+    integrity._memoized_digest.cache_clear()
+
+    first = calculate_sha256(target)
+    assert calculate_sha256(target) == first
+    assert len(calls) == 1
+
+    target.write_text("two\n")
+    os.utime(target, ns=(10**18 + 1, 10**18 + 1))
+    assert calculate_sha256(target) != first
+    assert len(calls) == 2
+
+def test_memory_sandbox_checks_current_rss_only_past_peak(monkeypatch):
+    import recon_filter.security.sandbox as sandbox
+    from recon_filter.security.sandbox import enforce_memory_sandbox
+    if not sandbox.HAS_RESOURCE:
+        pytest.skip("resource module unavailable")
+    rss_reads = []
+    monkeypatch.setattr(sandbox, "_current_rss", lambda: rss_reads.append(1) or 1)
+    enforce_memory_sandbox()
+    assert rss_reads == []
+
+    # Peak above the limit: the current RSS decides
+    monkeypatch.setattr(sandbox, "MEMORY_CRITICAL_BYTES", 1)
+    monkeypatch.setattr(sandbox, "_current_rss", lambda: 1)
+    enforce_memory_sandbox()
+    monkeypatch.setattr(sandbox, "_current_rss", lambda: 2)
+    with pytest.raises(MemoryError):
+        enforce_memory_sandbox()
+
+def test_path_traversal_follows_symlinks_and_root_boundary(tmp_path):
+    from recon_filter.security.sandbox import validate_path_traversal
+    work = tmp_path / "work"
+    work.mkdir()
+    os.symlink("/etc", work / "etclink")
+    os.symlink("/etc/hostname", work / "host")
+    for target in ("etclink/passwd", "host", "etclink/ssl/../passwd"):
+        with pytest.raises(PermissionError):
+            validate_path_traversal(work / target)
+    validate_path_traversal(work / "data.txt", allowed_root=work)
+    with pytest.raises(PermissionError):
+        validate_path_traversal(tmp_path / "work2" / "data.txt", allowed_root=work)
+
+def test_path_traversal_rechecks_directory_swapped_for_symlink(tmp_path):
+    from recon_filter.security.sandbox import validate_path_traversal
+    work = tmp_path / "work"
+    work.mkdir()
+    validate_path_traversal(work / "passwd")
+    work.rmdir()
+    os.symlink("/etc", work)
+    with pytest.raises(PermissionError):
+        validate_path_traversal(work / "passwd")
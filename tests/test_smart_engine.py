@@ -0,0 +1,71 @@
+import pytest
+from recon_filter.engine.smart_engine import IntelligenceEngine, risk_tag, HAS_RAPIDFUZZ
+
+def test_keyword_exact_and_fuzzy_scoring():
+    engine = IntelligenceEngine(fuzzy_threshold=0.75)
+    
+    score, matched = engine._keyword_score("https://x.com/passwrd?debug=1", ["password", "debug", "zebra"])
+    
+    assert "debug" in matched
+    assert "password~" in matched
+    assert "zebra" not in matched and "zebra~" not in matched
+    assert score == 5 + int(9 * 0.6)
+
+@pytest.mark.skipif(HAS_RAPIDFUZZ, reason="memoization only backs the difflib fallback")
+def test_fuzzy_verdicts_are_memoized():
+    engine = IntelligenceEngine()
+    
+    engine.analyze("https://x.com/admn", ["admin"])
+    engine.analyze("https://x.com/admn", ["admin"])
+    
+    assert engine._is_similar.cache_info().hits > 0
+
+def test_risk_tag_thresholds():
+    assert risk_tag(0) == "[LOW]"
+    assert risk_tag(8) == "[MEDIUM]"
+    assert risk_tag(15) == "[HIGH]"
+
+def test_overlapping_keywords_each_score():
+    engine = IntelligenceEngine()
+    
+    score, matched = engine._keyword_score("GET /v1/apikey", ["api", "apikey", "key"])
+    
+    assert matched == ["api", "apikey", "key"]
+    assert score == 3 + 10 + 3
+
+def test_heuristic_categories_score_once_each():
+    assert IntelligenceEngine._heuristic_score("https://x.com/admin/api/v1/dump.sql") == 6 + 4 + 5
+    assert IntelligenceEngine._heuristic_score("https://x.com/wp-admin/administrator") == 6
+    assert IntelligenceEngine._heuristic_score("https://x.com/staging/index.html") == 3
+    assert IntelligenceEngine._heuristic_score("https://x.com/about") == 0
+
+
+def test_analyze_mixed_case_url():
+    engine = IntelligenceEngine()
+    score, tag, classification, matched = engine.analyze("  HTTPS://x.com/Admin/db.SQL?Token=1 ", ["admin"])
+    assert classification == "url"
+    assert matched == ["admin"]
+    # keyword 8 + .sql 9 + token param 9 + depth 2 + admin heuristic 6
+    assert score == 8 + 9 + 9 + 2 + 6
+    assert tag == "[HIGH]"
+
+
+def test_fuzzy_prefilter_agrees_with_difflib(monkeypatch):
+    from difflib import SequenceMatcher
+    from recon_filter.engine import smart_engine
+    monkeypatch.setattr(smart_engine, "HAS_RAPIDFUZZ", False)
+    engine = IntelligenceEngine(fuzzy_threshold=0.75)
+    
+    tokens = ["passwrd", "pass", "passwordreset", "xyzzy", "dmin", "adm", "administrator", "aaaa", "qq"]
+    for keyword in ["password", "admin", "aaa", "db"]:
+        for token in tokens:
+            expected = SequenceMatcher(None, keyword, token).ratio() >= 0.75
+            assert engine._fuzzy_match(keyword, [token]) == expected, (keyword, token)
+
+
+def test_compiled_analyze_matches_analyze():
+    engine = IntelligenceEngine()
+    keywords = ["Secret", "login", "backup"]
+    analyze_line = engine.compile(keywords)
+    for line in ["https://x.com/LOGIN?secret=1", "/srv/backups/db.sql", "nothing here"]:
+        assert analyze_line(line) == engine.analyze(line, keywords)
@@ -0,0 +1,125 @@
+import io
+import json
+import time
+
+from recon_filter.engine import update_check
+from recon_filter.engine.update_check import UpdateChecker
+from recon_filter.version import __version__
+
+def test_background_check_defers_notice_to_next_run(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    checker = UpdateChecker()
+    monkeypatch.setattr(checker, "_parse_version", lambda text: "99.0.0")
+    
+    class FakeResponse:
+        status = 200
+        def read(self, size=-1): return b'__version__ = "99.0.0"'
+        def getheader(self, name): return None
+    class FakeConnection:
+        def __init__(self, host, timeout): pass
+        def request(self, method, path, headers): pass
+        def getresponse(self): return FakeResponse()
+        def close(self): pass
+    monkeypatch.setattr("http.client.HTTPSConnection", FakeConnection)
+    
+    printed = []
+    monkeypatch.setattr(checker, "_print_notice", printed.append)
+    
+    thread = checker.check_in_background()
+    assert thread is not None
+    thread.join(timeout=5)
+    assert printed == []
+    
+    assert checker.state_file.exists()
+    assert json.loads(checker.notice_file.read_text())["latest_version"] == "99.0.0"
+    
+    # Next invocation: fresh cache, notice shown, no new fetch
+    assert checker.check_in_background() is None
+    assert printed == ["99.0.0"]
+
+def test_background_check_claims_before_fetching(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    checker = UpdateChecker()
+    # A fetch that never completes, as when a short command exits before the thread finishes
+    monkeypatch.setattr(checker, "_refresh_quietly", lambda: None)
+
+    assert checker.check_in_background() is not None
+    assert checker.state_file.exists()
+    assert checker.check_in_background() is None
+
+def test_notice_goes_to_stderr(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(update_check, "_notice_printed", False)
+    checker = UpdateChecker()
+    checker.state_file.parent.mkdir(parents=True)
+    checker.state_file.write_text("{}")
+    checker.notice_file.write_text(json.dumps({"latest_version": "99.0.0"}))
+
+    assert checker.check_in_background() is None
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "99.0.0" in captured.err
+
+def test_notice_prints_once_per_process(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(update_check, "_notice_printed", False)
+    checker = UpdateChecker()
+    checker.state_file.parent.mkdir(parents=True)
+    checker.state_file.write_text("{}")
+    checker.notice_file.write_text(json.dumps({"latest_version": "99.0.0"}))
+    monkeypatch.setattr(checker, "_fetch_remote_version", lambda: "99.0.0")
+
+    # Startup check followed by `update --check` in the same process
+    checker.check_in_background()
+    checker.check_for_updates(force=True)
+    assert capsys.readouterr().err.count("99.0.0") == 1
+
+def test_background_check_skips_fresh_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    checker = UpdateChecker()
+    checker.state_file.parent.mkdir(parents=True)
+    checker.state_file.write_text(json.dumps({"last_check_time": time.time(), "latest_version": __version__}))
+    
+    assert checker.check_in_background() is None
+
+def test_unchanged_etag_keeps_recorded_notice(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    checker = UpdateChecker()
+    checker.state_file.parent.mkdir(parents=True)
+    checker.state_file.write_text(json.dumps({"last_check_time": 0, "etag": '"abc"'}))
+    checker.notice_file.write_text(json.dumps({"latest_version": "99.0.0"}))
+    sent = {}
+
+    class NotModified:
+        status = 304
+    class FakeConnection:
+        def __init__(self, host, timeout): pass
+        def request(self, method, path, headers): sent.update(headers)
+        def getresponse(self): return NotModified()
+        def close(self): pass
+    monkeypatch.setattr("http.client.HTTPSConnection", FakeConnection)
+
+    assert checker._fetch_remote_version() == "99.0.0"
+    assert sent["If-None-Match"] == '"abc"'
+    state = json.loads(checker.state_file.read_text())
+    assert state["etag"] == '"abc"' and state["last_check_time"] > 0
+    assert checker.notice_file.exists()
+
+def test_version_read_stops_at_version_line(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    body = io.BytesIO(b'"""Version."""\n__version__ = "3.1.4"\n' + b"#" * 100000)
+    assert UpdateChecker()._read_version(body) == "3.1.4"
+    assert body.tell() < 1024
+
+def test_network_failures_are_silent(tmp_path, monkeypatch):
+    import http.client
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    checker = UpdateChecker()
+    for error in (ConnectionRefusedError(), http.client.RemoteDisconnected("closed")):
+        class FailingConnection:
+            def __init__(self, host, timeout): pass
+            def request(self, method, path, headers): raise error
+            def close(self): pass
+        monkeypatch.setattr("http.client.HTTPSConnection", FailingConnection)
+        checker.check_for_updates(force=True)
+        checker._refresh_quietly()
@@ -49,3 +49,62 @@ def test_url_analyzer_depth_extraction():
     assert analyzer.extract_depth("https://test.com/") == 0
     assert analyzer.extract_depth("https://test.com/api") == 1
     assert analyzer.extract_depth("https://test.com/api/v1/users") == 3
+
+def test_parameter_report_written(tmp_path):
+    import json
+    from recon_filter.engine.core import EngineProcessor
+    
+    txt_path = tmp_path / "urls.txt"
+    txt_path.write_text("https://test.com/login?user=admin&id=5\nhttps://test.com/?user=root\n")
+    
+    config = FilterConfig(keywords=["test.com"], param_report=True, no_backup=True)
+    EngineProcessor(txt_path, tmp_path, config).process()
+    
+    report = json.loads((tmp_path / "parameters.json").read_text())
+    counts = {p["parameter_name"]: p["detected_count"] for p in report["parameters"]}
+    assert counts == {"user": 2, "id": 1}
+
+def test_http_prefix_fast_path_matches_urlparse():
+    cases = [
+        "http://", "https://", "http:///x", "http://x.com", "https://x.com/a?b=1", "http://?q", "http://[::1]/", "http://[::1", "http://:80",
+        "http://a]b/x", "http://\t/x", "http://\r\n/x", "http://a\x00b/x", "http://a b/x", "http://a\x7f/x", "http://ex\uff03ample.com/x",
+    ]
+    fast = UrlAnalyzer(FilterConfig(strict_url=True))
+    slow = UrlAnalyzer(FilterConfig(strict_url=True))
+    slow._needs_parse = True
+    for token in cases:
+        assert fast.analyze_token(token) == slow.analyze_token(token), token
+
+def test_extract_extension_string_scan():
+    analyzer = UrlAnalyzer(FilterConfig())
+    assert analyzer.extract_extension("https://x.com") == "none"
+    assert analyzer.extract_extension("https://x.com/a/Index.PHP?x=1.js") == ".php"
+    assert analyzer.extract_extension("x.com/static/app.js#v1.2") == ".js"
+    assert analyzer.extract_extension("https://x.com/report.pdf;jsessionid=1") == ".pdf"
+    assert analyzer.extract_extension("https://x.com?next=/a.php") == "none"
+    assert analyzer.extract_extension("https://x.com/.env") == ".env"
+    # A URL in the query of a scheme-less token must not be mistaken for the token's own scheme
+    assert analyzer.extract_extension("example.com/login.php?next=https://evil.com/x.js") == ".php"
+    assert analyzer.extract_extension("example.com/login.php#https://evil.com/x.js") == ".php"
+
+def test_extract_extension_matches_urlparse():
+    from urllib.parse import urlparse
+    def reference(token):
+        last = urlparse(token if "://" in token else f"http://{token}").path.split("/")[-1]
+        ext = last.split(".")[-1] if "." in last else ""
+        return f".{ext.lower()}" if ext.isalnum() else "none"
+    analyzer = UrlAnalyzer(FilterConfig())
+    cases = [
+        "example.com/login.php?next=https://evil.com/x.js", "x.com/r/https://e/x.js", "HTTPS://X.com/A.PHP",
+        "ftp://h/f.txt", "x.com/a/b.tar.gz", "https://x.com/a.b/c", "www.x.com/a.aspx;s=1", "//x.com/a.js", "a.js",
+    ]
+    for token in cases:
+        assert analyzer.extract_extension(token) == reference(token), token
+
+def test_parameter_counts_match_parse_qs():
+    from urllib.parse import parse_qs
+    for query in ["a=1&b=2&a=3", "a=&b", "=x&&c=1", "na%20me=1&x+y=2&x+y=3", "q"]:
+        analyzer = UrlAnalyzer(FilterConfig(extract_params=True))
+        analyzer.analyze_token(f"https://x.com/p?{query}")
+        expected = {name: len(values) for name, values in parse_qs(query).items()}
+        assert dict(analyzer.param_metrics) == expected, query